@@ -62,6 +62,8 @@ ITEMS_10Q = {
 # Request Settings
 REQUEST_TIMEOUT = 30  # seconds
 REQUEST_DELAY = 0.1  # SEC recommends no more than 10 requests per second
+SEC_MAX_REQUESTS_PER_SECOND = 10  # shared token-bucket rate for all EDGAR requests
+HTTP_POOL_MAXSIZE = 16  # keep-alive connections per host; >= downloader --workers
 
 # Logging
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
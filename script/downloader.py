@@ -5,14 +5,23 @@ Primary filing downloader (EDGAR only).
 from __future__ import annotations
 
 import argparse
+import calendar
 import csv
+import io
 import json
+import os
 import re
 import sys
+import threading
 import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import DefaultDict, Dict, List, Optional, Set, Tuple
+
+import requests
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
@@ -20,6 +29,7 @@ if str(PROJECT_ROOT) not in sys.path:
 
 from src.downloader import SECDownloader
 from src.index_parser import SECIndexParser
+from src.json_utils import read_json, write_json
 from src.submission_parser import extract_period_of_report
 
 
@@ -34,6 +44,13 @@ FILING_CODE_MAP: Dict[str, Tuple[str, str]] = {
     "10ka": ("10-K/A", "10-KA"),
 }
 
+# Serializes the exists-check + write in _save_filing_and_meta when --workers > 1,
+# so two records resolving to the same fiscal-year filing cannot both write it.
+_SAVE_LOCK = threading.Lock()
+
+# Minimum seconds between [EDGAR] progress lines (the last record always reports).
+PROGRESS_INTERVAL_SECONDS = 2.0
+
 
 def _get_filtered_records(
     *,
@@ -41,27 +58,36 @@ def _get_filtered_records(
     fiscal_years: List[int],
     lookahead_months: int,
     target_ciks: Set[str],
+    user_agent: str,
+    session: Optional[requests.Session] = None,
 ) -> List[Dict[str, str]]:
-    index_parser = SECIndexParser()
     index_years = sorted(set(y for fy in fiscal_years for y in (fy, fy + 1)))
-    records = index_parser.get_filing_records_for_filing(sec_form, index_years)
+    with SECIndexParser(user_agent=user_agent, session=session) as index_parser:
+        records = index_parser.get_filing_records_for_filing(sec_form, index_years)
     print(f"Loaded index records: {len(records)} ({sec_form}, years={index_years})")
 
-    unique_by_accession: Dict[str, Dict[str, str]] = {}
-    for r in records:
-        acc = r.get("accession_number", "")
-        if acc:
-            unique_by_accession[acc] = r
-    deduped_records = list(unique_by_accession.values())
-    print(f"Unique records by accession: {len(deduped_records)}")
+    # Last row per accession wins (co-registrant rows share an accession), in
+    # first-seen order; the filter pass reads the dict's values in place.
+    unique_by_accession: Dict[str, Dict[str, str]] = {
+        r["accession_number"]: r for r in records if r.get("accession_number")
+    }
+    print(f"Unique records by accession: {len(unique_by_accession)}")
 
+    windows = _fy_windows(fiscal_years, lookahead_months)
+    # An index year has only a few hundred distinct filing dates, so the
+    # window test is decided once per date and then looked up per row.
+    date_in_scope: Dict[str, bool] = {}
     filtered_records: List[Dict[str, str]] = []
-    for r in deduped_records:
-        cik = (r.get("cik_padded") or "").zfill(10)
-        if target_ciks and cik not in target_ciks:
+    for r in unique_by_accession.values():
+        if target_ciks and _pad_cik(r.get("cik_padded")) not in target_ciks:
             continue
         fd = r.get("date_filed", "")
-        if any(_in_window_for_fiscal_year(fd, fy, lookahead_months) for fy in fiscal_years):
+        in_scope = date_in_scope.get(fd)
+        if in_scope is None:
+            filed = _filing_ordinal(fd)
+            in_scope = filed is not None and any(start <= filed <= end for start, end in windows)
+            date_in_scope[fd] = in_scope
+        if in_scope:
             filtered_records.append(r)
     print(f"Records in scope after filters: {len(filtered_records)}")
     return filtered_records
@@ -80,23 +106,28 @@ def _write_list_only_report(
     stats_dir.mkdir(parents=True, exist_ok=True)
     stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-    rows: List[Dict[str, object]] = []
-    for fy in fiscal_years:
-        ciks = set()
-        filings = 0
-        for r in filtered_records:
-            fd = r.get("date_filed", "")
-            if _in_window_for_fiscal_year(fd, fy, lookahead_months):
-                filings += 1
-                ciks.add((r.get("cik_padded") or "").zfill(10))
-        rows.append({"fiscal_year": fy, "cik_count": len(ciks), "filing_count": filings})
+    windows = list(zip(fiscal_years, _fy_windows(fiscal_years, lookahead_months)))
+    filing_counts: Counter[int] = Counter()
+    cik_sets: Dict[int, Set[str]] = {fy: set() for fy in fiscal_years}
+    for r in filtered_records:
+        filed = _filing_ordinal(r.get("date_filed", ""))
+        if filed is None:
+            continue
+        for fy, (start, end) in windows:
+            if start <= filed <= end:
+                filing_counts[fy] += 1
+                cik_sets[fy].add(_pad_cik(r.get("cik_padded")))
+    rows: List[Dict[str, object]] = [
+        {"fiscal_year": fy, "cik_count": len(cik_sets[fy]), "filing_count": filing_counts[fy]}
+        for fy in fiscal_years
+    ]
 
     out_csv = logs_dir / f"list_only_{sec_form.lower().replace('/', '').replace('-', '')}_{stamp}.csv"
-    with out_csv.open("w", encoding="utf-8", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=["fiscal_year", "cik_count", "filing_count"])
-        w.writeheader()
-        for row in rows:
-            w.writerow(row)
+    buf = io.StringIO()
+    w = csv.DictWriter(buf, fieldnames=["fiscal_year", "cik_count", "filing_count"])
+    w.writeheader()
+    w.writerows(rows)
+    out_csv.write_text(buf.getvalue(), encoding="utf-8", newline="")
 
     out_md = stats_dir / f"list_only_{sec_form.lower().replace('/', '').replace('-', '')}_{stamp}.md"
     lines = [
@@ -112,8 +143,7 @@ def _write_list_only_report(
         "| Fiscal Year | CIK Count | Filing Count |",
         "|---|---:|---:|",
     ]
-    for row in rows:
-        lines.append(f"| {row['fiscal_year']} | {row['cik_count']} | {row['filing_count']} |")
+    lines.extend(f"| {row['fiscal_year']} | {row['cik_count']} | {row['filing_count']} |" for row in rows)
     lines.extend(
         [
             "",
@@ -132,8 +162,8 @@ def _write_download_run_report(
     fiscal_years: List[int],
     lookahead_months: int,
     output_dir: Path,
-    stats_total: Dict[str, int],
-    stats_by_year: Dict[int, Dict[str, int]],
+    stats_total: Counter[str],
+    stats_by_year: DefaultDict[int, Counter[str]],
 ) -> None:
     logs_dir = PROJECT_ROOT / "logs"
     stats_dir = PROJECT_ROOT / "stats"
@@ -143,31 +173,23 @@ def _write_download_run_report(
     code = sec_form.lower().replace("/", "").replace("-", "")
 
     csv_path = logs_dir / f"download_run_{code}_{stamp}.csv"
-    with csv_path.open("w", encoding="utf-8", newline="") as f:
-        w = csv.DictWriter(
-            f,
-            fieldnames=[
-                "fiscal_year",
-                "downloaded",
-                "skipped_exists",
-                "missing_fiscal_metadata",
-                "failed_download",
-                "skipped_outside_target_fy",
-            ],
-        )
-        w.writeheader()
-        for fy in fiscal_years:
-            row = stats_by_year.get(fy, {})
-            w.writerow(
-                {
-                    "fiscal_year": fy,
-                    "downloaded": row.get("downloaded", 0),
-                    "skipped_exists": row.get("skipped_exists", 0),
-                    "missing_fiscal_metadata": row.get("missing_fiscal_metadata", 0),
-                    "failed_download": row.get("failed_download", 0),
-                    "skipped_outside_target_fy": row.get("skipped_outside_target_fy", 0),
-                }
-            )
+    fieldnames = [
+        "fiscal_year",
+        "downloaded",
+        "skipped_exists",
+        "missing_fiscal_metadata",
+        "failed_download",
+        "skipped_outside_target_fy",
+    ]
+    rows = [
+        {"fiscal_year": fy, **{k: stats_by_year[fy][k] for k in fieldnames[1:]}}
+        for fy in fiscal_years
+    ]
+    buf = io.StringIO()
+    w = csv.DictWriter(buf, fieldnames=fieldnames)
+    w.writeheader()
+    w.writerows(rows)
+    csv_path.write_text(buf.getvalue(), encoding="utf-8", newline="")
 
     md_path = stats_dir / f"download_run_{code}_{stamp}.md"
     lines = [
@@ -181,24 +203,23 @@ def _write_download_run_report(
         f"- Output dir: `{output_dir}`",
         "",
         "## Totals",
-        f"- Processed: `{stats_total.get('processed', 0)}`",
-        f"- Downloaded: `{stats_total.get('downloaded', 0)}`",
-        f"- Skipped exists: `{stats_total.get('skipped_exists', 0)}`",
-        f"- Failed download: `{stats_total.get('failed_download', 0)}`",
-        f"- Missing fiscal metadata: `{stats_total.get('missing_fiscal_metadata', 0)}`",
-        f"- Skipped outside target FY: `{stats_total.get('skipped_outside_target_fy', 0)}`",
+        f"- Processed: `{stats_total['processed']}`",
+        f"- Downloaded: `{stats_total['downloaded']}`",
+        f"- Skipped exists: `{stats_total['skipped_exists']}`",
+        f"- Failed download: `{stats_total['failed_download']}`",
+        f"- Missing fiscal metadata: `{stats_total['missing_fiscal_metadata']}`",
+        f"- Skipped outside target FY: `{stats_total['skipped_outside_target_fy']}`",
         "",
         "## Yearly Measurements",
         "| Fiscal Year | Downloaded | Skipped Exists | Missing Fiscal Metadata | Failed Download | Skipped Outside Target FY |",
         "|---|---:|---:|---:|---:|---:|",
     ]
-    for fy in fiscal_years:
-        row = stats_by_year.get(fy, {})
-        lines.append(
-            f"| {fy} | {row.get('downloaded', 0)} | {row.get('skipped_exists', 0)} | "
-            f"{row.get('missing_fiscal_metadata', 0)} | {row.get('failed_download', 0)} | "
-            f"{row.get('skipped_outside_target_fy', 0)} |"
-        )
+    lines.extend(
+        f"| {row['fiscal_year']} | {row['downloaded']} | {row['skipped_exists']} | "
+        f"{row['missing_fiscal_metadata']} | {row['failed_download']} | "
+        f"{row['skipped_outside_target_fy']} |"
+        for row in rows
+    )
     lines.extend(
         [
             "",
@@ -218,7 +239,7 @@ def _report_progress(
     processed: int,
     total: int,
     start_time: float,
-    stats: Dict[str, int],
+    stats: Counter[str],
 ) -> None:
     if processed <= 0 or total <= 0:
         return
@@ -231,13 +252,31 @@ def _report_progress(
         f"[EDGAR] {processed}/{total} ({pct:.1f}%) | "
         f"elapsed {elapsed/60.0:.1f}m / expected {expected_total/60.0:.1f}m | "
         f"ETA {eta/60.0:.1f}m | "
-        f"downloaded={stats.get('downloaded', 0)} "
-        f"exists={stats.get('skipped_exists', 0)} "
-        f"failed={stats.get('failed_download', 0)}"
+        f"downloaded={stats['downloaded']} "
+        f"exists={stats['skipped_exists']} "
+        f"failed={stats['failed_download']}"
     )
 
 
+@lru_cache(maxsize=65536)
 def _parse_filing_date(value: str) -> Optional[date]:
+    # Fast path: slice EDGAR's fixed-width shapes (YYYY-MM-DD, YYYYMMDD,
+    # YYYY-MM) directly; strptime below only sees unusual values.
+    n = len(value)
+    if n == 10 and value[4] == "-" and value[7] == "-":
+        parts = (value[:4], value[5:7], value[8:])
+    elif n == 8:
+        parts = (value[:4], value[4:6], value[6:])
+    elif n == 7 and value[4] == "-":
+        parts = (value[:4], value[5:], "01")
+    else:
+        parts = None
+    if parts is not None and all(p.isascii() and p.isdigit() for p in parts):
+        try:
+            return date(int(parts[0]), int(parts[1]), int(parts[2]))
+        except ValueError:
+            return None
+
     for fmt in ("%Y-%m-%d", "%Y-%m", "%Y%m%d"):
         try:
             parsed = datetime.strptime(value, fmt).date()
@@ -249,38 +288,86 @@ def _parse_filing_date(value: str) -> Optional[date]:
     return None
 
 
-def _in_window_for_fiscal_year(filing_date: str, fiscal_year: int, lookahead_months: int) -> bool:
+def _filing_ordinal(filing_date: str) -> Optional[int]:
     filed = _parse_filing_date(filing_date)
-    if not filed:
-        return False
+    return filed.toordinal() if filed else None
 
-    start = date(fiscal_year, 1, 1)
-    if lookahead_months == 6:
-        end = date(fiscal_year + 1, 6, 30)
-    else:
-        month = 12 + lookahead_months
-        end_year = fiscal_year + (month - 1) // 12
-        end_month = ((month - 1) % 12) + 1
-        if end_month in {1, 3, 5, 7, 8, 10, 12}:
-            end_day = 31
-        elif end_month in {4, 6, 9, 11}:
-            end_day = 30
-        else:
-            leap = (end_year % 4 == 0 and end_year % 100 != 0) or (end_year % 400 == 0)
-            end_day = 29 if leap else 28
-        end = date(end_year, end_month, end_day)
+
+@lru_cache(maxsize=None)
+def _fy_window(fiscal_year: int, lookahead_months: int) -> Tuple[int, int]:
+    """Filing-date window for a fiscal year as (start, end) date ordinals, inclusive."""
+    month = 12 + lookahead_months
+    end_year = fiscal_year + (month - 1) // 12
+    end_month = ((month - 1) % 12) + 1
+    end_day = calendar.monthrange(end_year, end_month)[1]
+    return date(fiscal_year, 1, 1).toordinal(), date(end_year, end_month, end_day).toordinal()
+
+
+def _fy_windows(fiscal_years: List[int], lookahead_months: int) -> List[Tuple[int, int]]:
+    return [_fy_window(fy, lookahead_months) for fy in fiscal_years]
+
+
+def _in_window_for_fiscal_year(filing_date: str, fiscal_year: int, lookahead_months: int) -> bool:
+    filed = _filing_ordinal(filing_date)
+    if filed is None:
+        return False
+    start, end = _fy_window(fiscal_year, lookahead_months)
     return start <= filed <= end
 
 
+@lru_cache(maxsize=None)
+def _pad_cik(cik: Optional[str]) -> str:
+    # Index years repeat a few thousand CIKs across many rows; one shared,
+    # interned padded string per CIK keeps set lookups and memory cheap.
+    return sys.intern((cik or "").zfill(10))
+
+
 def _normalize_cik_set(ciks: Optional[List[str]]) -> Set[str]:
     result: Set[str] = set()
     for c in ciks or []:
         token = c.strip()
         if token:
-            result.add(token.zfill(10))
+            result.add(_pad_cik(token))
     return result
 
 
+def _scan_existing_filings(output_dir: Path, folder_form: str) -> Dict[Tuple[str, int], str]:
+    """
+    Index the filings already saved under output_dir.
+
+    One scandir walk of output_dir/<cik>/<fy>/<folder_form>/ replaces a stat()
+    per candidate record when resuming a run.
+
+    Returns:
+        {(cik, fiscal_year): accession_number} ("" if the meta file is
+        missing or unreadable)
+    """
+    existing: Dict[Tuple[str, int], str] = {}
+    try:
+        cik_entries = list(os.scandir(output_dir))
+    except (FileNotFoundError, NotADirectoryError):
+        return existing
+    for cik_entry in cik_entries:
+        if not cik_entry.is_dir():
+            continue
+        try:
+            year_entries = list(os.scandir(cik_entry.path))
+        except OSError:
+            continue
+        for year_entry in year_entries:
+            if not year_entry.is_dir() or not year_entry.name.isdigit():
+                continue
+            base = os.path.join(year_entry.path, folder_form, f"{cik_entry.name}_{year_entry.name}_{folder_form}")
+            if not os.path.isfile(f"{base}.txt"):
+                continue
+            try:
+                accession = str(read_json(f"{base}_meta.json").get("accession_number") or "")
+            except (OSError, ValueError, AttributeError):
+                accession = ""
+            existing[(cik_entry.name, int(year_entry.name))] = accession
+    return existing
+
+
 def _save_filing_and_meta(
     output_dir: Path,
     cik: str,
@@ -289,22 +376,120 @@ def _save_filing_and_meta(
     submission_text: str,
     meta: Dict[str, object],
     overwrite: bool,
+    existing: Optional[Dict[Tuple[str, int], str]] = None,
 ) -> str:
-    filing_dir = output_dir / cik / str(fiscal_year) / folder_form
-    filing_dir.mkdir(parents=True, exist_ok=True)
-    base_name = f"{cik}_{fiscal_year}_{folder_form}"
-    filing_path = filing_dir / f"{base_name}.txt"
-    meta_path = filing_dir / f"{base_name}_meta.json"
-
-    if filing_path.exists() and not overwrite:
-        return "skipped_exists"
-
-    filing_path.write_text(submission_text, encoding="utf-8")
-    with meta_path.open("w", encoding="utf-8") as f:
-        json.dump(meta, f, indent=2)
+    # Plain string joins: this runs per record and the paths are only opened.
+    filing_dir = os.path.join(output_dir, cik, str(fiscal_year), folder_form)
+    base = os.path.join(filing_dir, f"{cik}_{fiscal_year}_{folder_form}")
+    filing_path = f"{base}.txt"
+
+    with _SAVE_LOCK:
+        if existing is not None:
+            # Pre-scanned index (see _scan_existing_filings), kept current below.
+            already_saved = (cik, fiscal_year) in existing
+        else:
+            already_saved = os.path.exists(filing_path)
+        if already_saved and not overwrite:
+            return "skipped_exists"
+
+        os.makedirs(filing_dir, exist_ok=True)
+        # One encode + one binary write; no text-layer chunking or newline
+        # translation on a multi-MB submission.
+        with open(filing_path, "wb") as f:
+            f.write(submission_text.encode("utf-8"))
+        write_json(f"{base}_meta.json", meta)
+        if existing is not None:
+            existing[(cik, fiscal_year)] = str(meta.get("accession_number") or "")
     return "downloaded"
 
 
+def _process_record(
+    record: Dict[str, str],
+    *,
+    downloader: SECDownloader,
+    sec_form: str,
+    folder_form: str,
+    fiscal_years: List[int],
+    output_dir: Path,
+    lookahead_months: int,
+    overwrite: bool,
+    existing: Optional[Dict[Tuple[str, int], str]] = None,
+    saved_accessions: Optional[Dict[str, int]] = None,
+) -> Tuple[str, Optional[int], str]:
+    """
+    Download, validate and save one index record.
+
+    Returns:
+        (state, fiscal_year, detail) where state is a stats key, fiscal_year is
+        set for downloaded/skipped_exists, and detail is the log suffix after
+        `result=<state>`.
+    """
+    accession = record.get("accession_number", "")
+    if not accession:
+        return "failed_download", None, " reason=missing_accession"
+
+    cik = _pad_cik(record.get("cik_padded"))
+    filing_date = record.get("date_filed", "")
+    if not overwrite and saved_accessions:
+        # Saved by an earlier run: its meta already records the fiscal year the
+        # download would resolve to, so skip the network round-trip.
+        saved_fy = saved_accessions.get(accession)
+        if (
+            saved_fy is not None
+            and saved_fy in fiscal_years
+            and _in_window_for_fiscal_year(filing_date, saved_fy, lookahead_months)
+        ):
+            return "skipped_exists", saved_fy, f" fiscal_year={saved_fy}"
+
+    try:
+        submission_text, normalized_cik = downloader.download_submission_text(
+            cik,
+            accession,
+            record.get("file_name", ""),
+        )
+    except Exception as e:
+        return "failed_download", None, f" reason={str(e)[:120]}"
+
+    period_of_report, fiscal_year, tags_found = extract_period_of_report(submission_text)
+    if fiscal_year is None:
+        return "missing_fiscal_metadata", None, ""
+    if fiscal_year not in fiscal_years or not _in_window_for_fiscal_year(
+        filing_date,
+        fiscal_year,
+        lookahead_months,
+    ):
+        return (
+            "skipped_outside_target_fy",
+            None,
+            f" fiscal_year={fiscal_year} period_of_report={period_of_report}",
+        )
+
+    meta = {
+        "source": "edgar",
+        "cik": normalized_cik,
+        "fiscal_year": fiscal_year,
+        "filing_type": sec_form,
+        "folder_form": folder_form,
+        "filing_date": filing_date,
+        "period_of_report": period_of_report,
+        "accession_number": accession,
+        "source_file_name": record.get("file_name", ""),
+        "tags_found": tags_found,
+        "ticker_symbols": [],
+    }
+    state = _save_filing_and_meta(
+        output_dir=output_dir,
+        cik=normalized_cik,
+        fiscal_year=fiscal_year,
+        folder_form=folder_form,
+        submission_text=submission_text,
+        meta=meta,
+        overwrite=overwrite,
+        existing=existing,
+    )
+    return state, fiscal_year, f" fiscal_year={fiscal_year}"
+
+
 def download_from_edgar(
     *,
     sec_form: str,
@@ -315,8 +500,18 @@ def download_from_edgar(
     ciks: Optional[List[str]],
     overwrite: bool,
     user_agent: str,
+    cache_dir: Optional[Path] = None,
+    workers: int = 1,
+    downloader: Optional[SECDownloader] = None,
 ) -> None:
-    downloader = SECDownloader(user_agent=user_agent)
+    workers = max(workers, 1)
+    # A caller-supplied downloader (and its session) is reused and left open.
+    owns_downloader = downloader is None
+    if downloader is None:
+        downloader = SECDownloader(
+            user_agent=user_agent,
+            cache_dir=str(cache_dir) if cache_dir else None,
+        )
 
     if date.today().month <= lookahead_months:
         print(
@@ -335,118 +530,90 @@ def download_from_edgar(
         fiscal_years=fiscal_years,
         lookahead_months=lookahead_months,
         target_ciks=target_ciks,
+        user_agent=user_agent,
+        session=downloader.session,
     )
 
-    stats = {
-        "processed": 0,
-        "downloaded": 0,
-        "skipped_exists": 0,
-        "failed_download": 0,
-        "missing_fiscal_metadata": 0,
-        "skipped_outside_target_fy": 0,
-    }
-    stats_by_year: Dict[int, Dict[str, int]] = {
-        fy: {
-            "downloaded": 0,
-            "skipped_exists": 0,
-            "missing_fiscal_metadata": 0,
-            "failed_download": 0,
-            "skipped_outside_target_fy": 0,
-        }
-        for fy in fiscal_years
-    }
+    # Counters read missing keys as 0; the zero-filled totals keep their key
+    # order for the printed summary.
+    stats: Counter[str] = Counter(
+        dict.fromkeys(
+            (
+                "processed",
+                "downloaded",
+                "skipped_exists",
+                "failed_download",
+                "missing_fiscal_metadata",
+                "skipped_outside_target_fy",
+            ),
+            0,
+        )
+    )
+    stats_by_year: DefaultDict[int, Counter[str]] = defaultdict(Counter)
     total = len(filtered_records)
     start_time = time.monotonic()
-    update_every = 1 if total <= 200 else max(1, total // 200)
-
-    for i, record in enumerate(filtered_records, start=1):
-        stats["processed"] += 1
-        cik = (record.get("cik_padded") or "").zfill(10)
-        accession = record.get("accession_number", "")
-        form_type = (record.get("form_type") or "").strip()
-        filing_date = record.get("date_filed", "")
-        status_prefix = (
-            f"[{i}/{total}] cik={cik} accession={accession} "
-            f"form={form_type or 'UNKNOWN'} filed={filing_date}"
+    last_report = start_time
+    existing = _scan_existing_filings(output_dir, folder_form)
+    saved_accessions = {acc: key[1] for key, acc in existing.items() if acc}
+
+    def process(record: Dict[str, str]) -> Tuple[str, Optional[int], str]:
+        return _process_record(
+            record,
+            downloader=downloader,
+            sec_form=sec_form,
+            folder_form=folder_form,
+            fiscal_years=fiscal_years,
+            output_dir=output_dir,
+            lookahead_months=lookahead_months,
+            overwrite=overwrite,
+            existing=existing,
+            saved_accessions=saved_accessions,
         )
-        if not accession:
-            stats["failed_download"] += 1
-            print(f"{status_prefix} result=failed_download reason=missing_accession")
-            continue
-
-        try:
-            submission_text, normalized_cik = downloader.download_submission_text(
-                cik,
-                accession,
-                record.get("file_name", ""),
-            )
-        except Exception as e:
-            stats["failed_download"] += 1
-            # Filing-date window already matched at least one target FY.
-            for fy in fiscal_years:
-                if _in_window_for_fiscal_year(filing_date, fy, lookahead_months):
-                    stats_by_year[fy]["failed_download"] += 1
-            print(f"{status_prefix} result=failed_download reason={str(e)[:120]}")
-            continue
 
-        period_of_report, fiscal_year, tags_found = extract_period_of_report(submission_text)
-        if fiscal_year is None:
-            stats["missing_fiscal_metadata"] += 1
-            for fy in fiscal_years:
-                if _in_window_for_fiscal_year(filing_date, fy, lookahead_months):
-                    stats_by_year[fy]["missing_fiscal_metadata"] += 1
-            print(f"{status_prefix} result=missing_fiscal_metadata")
-            continue
-        if fiscal_year not in fiscal_years or not _in_window_for_fiscal_year(
-            filing_date,
-            fiscal_year,
-            lookahead_months,
-        ):
-            stats["skipped_outside_target_fy"] += 1
+    # Downloads are network-bound: with workers > 1 requests overlap while the
+    # shared rate limiter in SECDownloader keeps the total within SEC's limit.
+    # Stats and logging stay on this thread, in completion order.
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    if executor is not None:
+        futures = {executor.submit(process, r): n for n, r in enumerate(filtered_records, start=1)}
+        results = ((futures[fut], fut.result()) for fut in as_completed(futures))
+    else:
+        results = ((n, process(r)) for n, r in enumerate(filtered_records, start=1))
+
+    try:
+        for i, (n, (state, fiscal_year, detail)) in enumerate(results, start=1):
+            record = filtered_records[n - 1]
+            filing_date = record.get("date_filed", "")
+            stats["processed"] += 1
+            stats[state] += 1
+            if fiscal_year is not None:
+                stats_by_year[fiscal_year][state] += 1
+            elif state in ("failed_download", "missing_fiscal_metadata") and record.get("accession_number"):
+                # Filing-date window already matched at least one target FY.
+                for fy in fiscal_years:
+                    if _in_window_for_fiscal_year(filing_date, fy, lookahead_months):
+                        stats_by_year[fy][state] += 1
             print(
-                f"{status_prefix} result=skipped_outside_target_fy "
-                f"fiscal_year={fiscal_year} period_of_report={period_of_report}"
+                f"[{n}/{total}] cik={_pad_cik(record.get('cik_padded'))} "
+                f"accession={record.get('accession_number', '')} "
+                f"form={(record.get('form_type') or '').strip() or 'UNKNOWN'} filed={filing_date} "
+                f"result={state}{detail}"
             )
-            continue
 
-        meta = {
-            "source": "edgar",
-            "cik": normalized_cik,
-            "fiscal_year": fiscal_year,
-            "filing_type": sec_form,
-            "folder_form": folder_form,
-            "filing_date": filing_date,
-            "period_of_report": period_of_report,
-            "accession_number": accession,
-            "source_file_name": record.get("file_name", ""),
-            "tags_found": tags_found,
-            "ticker_symbols": [],
-        }
-        state = _save_filing_and_meta(
-            output_dir=output_dir,
-            cik=normalized_cik,
-            fiscal_year=fiscal_year,
-            folder_form=folder_form,
-            submission_text=submission_text,
-            meta=meta,
-            overwrite=overwrite,
-        )
-        if state == "downloaded":
-            stats["downloaded"] += 1
-            stats_by_year[fiscal_year]["downloaded"] += 1
-            print(f"{status_prefix} result=downloaded fiscal_year={fiscal_year}")
-        else:
-            stats["skipped_exists"] += 1
-            stats_by_year[fiscal_year]["skipped_exists"] += 1
-            print(f"{status_prefix} result=skipped_exists fiscal_year={fiscal_year}")
-
-        if (i % update_every == 0) or (i == total):
-            _report_progress(
-                processed=i,
-                total=total,
-                start_time=start_time,
-                stats=stats,
-            )
+            now = time.monotonic()
+            if state in ("downloaded", "skipped_exists") and (
+                now - last_report >= PROGRESS_INTERVAL_SECONDS or i == total
+            ):
+                last_report = now
+                _report_progress(
+                    processed=i,
+                    total=total,
+                    start_time=start_time,
+                    stats=stats,
+                )
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
 
     print("EDGAR download completed.")
     print(json.dumps(stats, indent=2))
@@ -458,6 +625,8 @@ def download_from_edgar(
         stats_total=stats,
         stats_by_year=stats_by_year,
     )
+    if owns_downloader:
+        downloader.close()
 
 
 def main() -> None:
@@ -485,6 +654,17 @@ def main() -> None:
         required=True,
         help="Custom SEC User-Agent string (include contact email).",
     )
+    parser.add_argument(
+        "--cache_dir",
+        default=None,
+        help="Optional folder caching downloaded submission .txt files by accession across runs.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of filings downloaded concurrently; all workers share the SEC rate limit (default: 1).",
+    )
     args = parser.parse_args()
 
     filing_key = args.filing.strip().lower()
@@ -501,35 +681,45 @@ def main() -> None:
 
     target_ciks = _normalize_cik_set(args.ciks)
 
-    if args.list_only:
-        if target_ciks:
-            print(f"CIK filter enabled: {len(target_ciks)} target CIK(s)")
-        else:
-            print("CIK filter disabled: processing all CIKs in selected years/window")
-        filtered_records = _get_filtered_records(
-            sec_form=sec_form,
-            fiscal_years=fiscal_years,
-            lookahead_months=args.lookahead_months,
-            target_ciks=target_ciks,
-        )
-        _write_list_only_report(
+    # One downloader (one pooled session) serves the index and all filings.
+    downloader = SECDownloader(user_agent=args.user_agent, cache_dir=args.cache_dir)
+    try:
+        if args.list_only:
+            if target_ciks:
+                print(f"CIK filter enabled: {len(target_ciks)} target CIK(s)")
+            else:
+                print("CIK filter disabled: processing all CIKs in selected years/window")
+            filtered_records = _get_filtered_records(
+                sec_form=sec_form,
+                fiscal_years=fiscal_years,
+                lookahead_months=args.lookahead_months,
+                target_ciks=target_ciks,
+                user_agent=args.user_agent,
+                session=downloader.session,
+            )
+            _write_list_only_report(
+                sec_form=sec_form,
+                fiscal_years=fiscal_years,
+                lookahead_months=args.lookahead_months,
+                filtered_records=filtered_records,
+            )
+            return
+
+        download_from_edgar(
             sec_form=sec_form,
+            folder_form=folder_form,
             fiscal_years=fiscal_years,
+            output_dir=output_dir,
             lookahead_months=args.lookahead_months,
-            filtered_records=filtered_records,
+            ciks=args.ciks,
+            overwrite=args.overwrite,
+            user_agent=args.user_agent,
+            cache_dir=Path(args.cache_dir) if args.cache_dir else None,
+            workers=args.workers,
+            downloader=downloader,
         )
-        return
-
-    download_from_edgar(
-        sec_form=sec_form,
-        folder_form=folder_form,
-        fiscal_years=fiscal_years,
-        output_dir=output_dir,
-        lookahead_months=args.lookahead_months,
-        ciks=args.ciks,
-        overwrite=args.overwrite,
-        user_agent=args.user_agent,
-    )
+    finally:
+        downloader.close()
 
 
 if __name__ == "__main__":
@@ -9,48 +9,59 @@ Reads downloaded SEC submission .txt files from filing_dir and performs:
 from __future__ import annotations
 
 import argparse
-import json
+import csv
+import os
 import re
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache, partial
+from itertools import product
 from pathlib import Path
-from typing import Dict, List, Optional
-
-from bs4 import BeautifulSoup
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from script.config import ITEMS_10K, ITEMS_10Q
-from src.extractor import ItemExtractor
-from src.parser import SECParser
-from src.structure_extractor import StructureExtractor
+from src.json_utils import read_json, write_json
 from src.submission_parser import (
     build_document_lookup,
     extract_trading_symbols,
     resolve_image_document,
     select_primary_html_document,
     parse_submission_documents,
+    read_submission_text,
 )
 
+if TYPE_CHECKING:
+    from src.extractor import ItemExtractor
+    from src.parser import SECParser
+    from src.structure_extractor import StructureExtractor
+
+
+_ITEMS_10K_SCOPE = frozenset(ITEMS_10K)
+_ITEMS_10Q_SCOPE = frozenset(ITEMS_10Q)
 
 ITEM_SCOPE_BY_FILING = {
-    "10-K": set(ITEMS_10K.keys()),
-    "10-KA": set(ITEMS_10K.keys()),
-    "10-Q": set(ITEMS_10Q.keys()),
-    "10-QA": set(ITEMS_10Q.keys()),
+    "10-K": _ITEMS_10K_SCOPE,
+    "10-KA": _ITEMS_10K_SCOPE,
+    "10-Q": _ITEMS_10Q_SCOPE,
+    "10-QA": _ITEMS_10Q_SCOPE,
 }
 
 _PART_ORDER = {"I": 1, "II": 2, "III": 3, "IV": 4}
+_PART_ITEM_KEY_PATTERN = re.compile(r"^([IVX]+)_(\d+[A-Z]?)$")
 
 
+@lru_cache(maxsize=None)
 def _item_sort_key(item_num: str) -> tuple[int, int, str]:
     token = (item_num or "").strip().upper()
     part_rank = 0
     bare = token
-    match = re.match(r"^([IVX]+)_(\d+[A-Z]?)$", token)
+    match = _PART_ITEM_KEY_PATTERN.match(token)
     if match:
         part_rank = _PART_ORDER.get(match.group(1), 99)
         bare = match.group(2)
@@ -124,33 +135,80 @@ def _update_meta_tickers(
     if not meta_path.exists():
         return
     try:
-        payload = json.loads(meta_path.read_text(encoding="utf-8"))
-    except Exception:
+        payload = read_json(meta_path)
+    except (OSError, ValueError):
+        return
+    tickers = list(tickers)
+    if payload.get("ticker_symbols") == tickers:
         return
-    payload["ticker_symbols"] = list(tickers)
-    meta_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    payload["ticker_symbols"] = tickers
+    write_json(meta_path, payload)
 
 
-def _upsert_ticker_map(
+class _CikTickerMapCache:
+    """
+    In-memory cik_ticker_map.csv rows.
+
+    Loaded once per run, updated per filing, and written once by flush(),
+    instead of a full CSV read-modify-write for every filing. Without a
+    map_path it only collects rows (per-task buffer merged by the caller).
+    """
+
+    def __init__(self, map_path: Optional[Path] = None) -> None:
+        self.map_path = map_path
+        self.rows: Dict[tuple[str, str], Dict[str, str]] = (
+            _load_cik_ticker_rows(map_path) if map_path is not None else {}
+        )
+        self._dirty = False
+
+    def upsert(self, *, cik: str, year: str, ticker: Optional[str]) -> None:
+        token = (ticker or "").strip().upper()
+        if not token:
+            return
+        self.rows[(year, cik.zfill(10))] = {
+            "fiscal_year": year,
+            "cik": cik.zfill(10),
+            "ticker": token,
+            "source": "extractor",
+            "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        self._dirty = True
+
+    def merge(self, rows: Dict[tuple[str, str], Dict[str, str]]) -> None:
+        if rows:
+            self.rows.update(rows)
+            self._dirty = True
+
+    def flush(self) -> None:
+        if self._dirty and self.map_path is not None:
+            _save_cik_ticker_rows(self.map_path, self.rows)
+            self._dirty = False
+
+
+def _record_filing_tickers(
     *,
-    filing_dir: Path,
-    cik: str,
-    year: str,
-    ticker: Optional[str],
+    txt_path: Path,
+    meta: Dict[str, str],
+    html_content: str,
+    ticker_map: _CikTickerMapCache,
 ) -> None:
-    token = (ticker or "").strip().upper()
-    if not token:
-        return
-    map_path = filing_dir / "_meta" / "cik_ticker_map.csv"
-    rows = _load_cik_ticker_rows(map_path)
-    rows[(year, cik.zfill(10))] = {
-        "fiscal_year": year,
-        "cik": cik.zfill(10),
-        "ticker": token,
-        "source": "extractor",
-        "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-    }
-    _save_cik_ticker_rows(map_path, rows)
+    tickers = _extract_ixbrl_tickers(html_content)
+    _update_meta_tickers(txt_path=txt_path, tickers=tickers)
+    ticker_map.upsert(
+        cik=str(meta["cik"]),
+        year=str(meta["year"]),
+        ticker=tickers[0] if tickers else None,
+    )
+
+
+def _scan_dir(path: Union[str, Path]) -> List[os.DirEntry]:
+    # DirEntry caches the file type from the directory read, so the
+    # is_dir()/is_file() checks below do not need a stat() per entry.
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except (FileNotFoundError, NotADirectoryError):
+        return []
 
 
 def _list_filing_files(
@@ -160,32 +218,40 @@ def _list_filing_files(
     year_filter: Optional[set[str]],
 ) -> List[Path]:
     submission_files: List[Path] = []
+    form_filter = filing_filter.upper() if filing_filter else None
 
     if target_ciks:
-        cik_dirs = [filing_dir / t for t in sorted(target_ciks)]
+        cik_paths = [os.path.join(filing_dir, t) for t in sorted(target_ciks)]
     else:
-        cik_dirs = [p for p in filing_dir.iterdir() if p.is_dir()]
+        cik_paths = [e.path for e in _scan_dir(filing_dir) if e.is_dir()]
 
-    for cik_dir in cik_dirs:
-        if not cik_dir.exists() or not cik_dir.is_dir():
-            continue
-        for year_dir in cik_dir.iterdir():
-            if not year_dir.is_dir():
+    if year_filter:
+        # Year folders are named by the filter itself, so address them
+        # directly instead of listing every year under each CIK.
+        year_paths = [os.path.join(c, y) for c, y in product(cik_paths, sorted(year_filter))]
+    else:
+        year_paths = [e.path for c in cik_paths for e in _scan_dir(c) if e.is_dir()]
+
+    for year_path in year_paths:
+        for form_entry in _scan_dir(year_path):
+            if not form_entry.is_dir():
                 continue
-            if year_filter and year_dir.name not in year_filter:
+            if form_filter and form_entry.name.upper() != form_filter:
                 continue
-            for form_dir in year_dir.iterdir():
-                if not form_dir.is_dir():
-                    continue
-                if filing_filter and form_dir.name.upper() != filing_filter.upper():
-                    continue
-                for f in form_dir.iterdir():
-                    if f.is_file() and f.suffix.lower() == ".txt":
-                        submission_files.append(f)
+            for f in _scan_dir(form_entry.path):
+                if f.name.lower().endswith(".txt") and f.is_file():
+                    submission_files.append(Path(f.path))
     submission_files.sort()
     return submission_files
 
 
+def _has_output(path: Path) -> bool:
+    try:
+        return path.stat().st_size > 0
+    except OSError:
+        return False
+
+
 def _parse_path_parts(path: Path, filing_dir: Path) -> Dict[str, str]:
     rel = path.relative_to(filing_dir)
     parts = rel.parts
@@ -198,7 +264,7 @@ def _parse_path_parts(path: Path, filing_dir: Path) -> Dict[str, str]:
 def _load_submission_context(txt_path: Path, filing_dir: Path) -> Optional[Dict[str, object]]:
     meta = _parse_path_parts(txt_path, filing_dir)
     filing_type = meta["filing"].upper()
-    submission_text = txt_path.read_text(encoding="utf-8", errors="ignore")
+    submission_text = read_submission_text(txt_path)
     documents = parse_submission_documents(submission_text)
     main_doc = select_primary_html_document(documents, filing_type)
     if not main_doc or not (main_doc.text or "").strip():
@@ -225,6 +291,38 @@ def _save_extracted_html(
     return html_path
 
 
+class _ImageSrcCollector:
+    """lxml parser target that records <img src> values without building a tree."""
+
+    def __init__(self) -> None:
+        self.srcs: List[str] = []
+
+    def start(self, tag: str, attrib: Dict[str, str]) -> None:
+        if tag == "img":
+            self.srcs.append(attrib.get("src") or "")
+
+    def end(self, tag: str) -> None:
+        pass
+
+    def data(self, data: str) -> None:
+        pass
+
+    def comment(self, text: str) -> None:
+        pass
+
+    def close(self) -> List[str]:
+        return self.srcs
+
+
+def _collect_image_srcs(item_html: str) -> List[str]:
+    from lxml import etree
+
+    collector = _ImageSrcCollector()
+    parser = etree.HTMLParser(target=collector)
+    parser.feed(item_html)
+    return parser.close()
+
+
 def _save_item_images(
     *,
     txt_path: Path,
@@ -242,11 +340,10 @@ def _save_item_images(
         if not isinstance(item_html, str) or not item_html.strip():
             continue
 
-        soup = BeautifulSoup(item_html, "html.parser")
         seen_srcs = set()
         image_index = 1
-        for img in soup.find_all("img"):
-            src = (img.get("src") or "").strip()
+        for raw_src in _collect_image_srcs(item_html):
+            src = raw_src.strip()
             if not src or src in seen_srcs:
                 continue
             seen_srcs.add(src)
@@ -274,10 +371,42 @@ def _extract_items_for_file(
     overwrite: bool,
     save_html: bool,
     save_images: bool,
+    ticker_map: _CikTickerMapCache,
 ) -> Optional[Path]:
-    base_name = txt_path.stem
-    item_out = txt_path.with_name(f"{base_name}_item.json")
-    context = _load_submission_context(txt_path, filing_dir)
+    item_out = txt_path.with_name(f"{txt_path.stem}_item.json")
+    # A previous run already produced this filing's items (and its ticker
+    # bookkeeping); skip the parse unless other outputs were requested.
+    if not overwrite and not save_html and not save_images and _has_output(item_out):
+        return item_out
+    out = _build_item_output(
+        txt_path=txt_path,
+        filing_dir=filing_dir,
+        parser=parser,
+        item_extractor=item_extractor,
+        overwrite=overwrite,
+        save_html=save_html,
+        save_images=save_images,
+        ticker_map=ticker_map,
+    )
+    return item_out if out is not None else None
+
+
+def _build_item_output(
+    *,
+    txt_path: Path,
+    filing_dir: Path,
+    parser: SECParser,
+    item_extractor: ItemExtractor,
+    overwrite: bool,
+    save_html: bool,
+    save_images: bool,
+    ticker_map: _CikTickerMapCache,
+    context: Optional[Dict[str, object]] = None,
+) -> Optional[Dict[str, object]]:
+    """Extract items for one submission, write *_item.json, and return the payload."""
+    item_out = txt_path.with_name(f"{txt_path.stem}_item.json")
+    if context is None:
+        context = _load_submission_context(txt_path, filing_dir)
     if context is None:
         return None
 
@@ -287,13 +416,11 @@ def _extract_items_for_file(
 
     meta = context["meta"]
     filing_type = str(meta["filing"]).upper()
-    tickers = _extract_ixbrl_tickers(html_content)
-    _update_meta_tickers(txt_path=txt_path, tickers=tickers)
-    _upsert_ticker_map(
-        filing_dir=filing_dir,
-        cik=str(meta["cik"]),
-        year=str(meta["year"]),
-        ticker=tickers[0] if tickers else None,
+    _record_filing_tickers(
+        txt_path=txt_path,
+        meta=meta,
+        html_content=html_content,
+        ticker_map=ticker_map,
     )
     toc_items = parser.parse_toc(html_content, filing_type)
     if not toc_items:
@@ -307,12 +434,11 @@ def _extract_items_for_file(
     if not selected:
         return None
 
-    extracted = {}
-    for item_num in sorted(selected.keys(), key=_item_sort_key):
-        try:
-            extracted[item_num] = item_extractor.extract_item(html_content, item_num, selected)
-        except Exception as e:
-            extracted[item_num] = {"error": str(e)}
+    extracted = item_extractor.extract_items(
+        html_content,
+        sorted(selected, key=_item_sort_key),
+        selected,
+    )
 
     saved_images = 0
     if save_images:
@@ -334,8 +460,8 @@ def _extract_items_for_file(
         "items": extracted,
     }
     if overwrite or not item_out.exists():
-        item_out.write_text(json.dumps(out, indent=2), encoding="utf-8")
-    return item_out
+        write_json(item_out, out)
+    return out
 
 
 def _extract_structure_for_file(
@@ -348,53 +474,59 @@ def _extract_structure_for_file(
     overwrite: bool,
     save_html: bool,
     save_images: bool,
+    ticker_map: _CikTickerMapCache,
 ) -> Optional[Path]:
     base_name = txt_path.stem
     str_out = txt_path.with_name(f"{base_name}_str.json")
+    if not overwrite and not save_html and not save_images and _has_output(str_out):
+        return str_out
 
     context = _load_submission_context(txt_path, filing_dir)
     if context is None:
         return None
     if save_html:
         _save_extracted_html(txt_path, str(context["html_content"]), overwrite)
-    meta = context["meta"]
-    tickers = _extract_ixbrl_tickers(str(context["html_content"]))
-    _update_meta_tickers(txt_path=txt_path, tickers=tickers)
-    _upsert_ticker_map(
-        filing_dir=filing_dir,
-        cik=str(meta["cik"]),
-        year=str(meta["year"]),
-        ticker=tickers[0] if tickers else None,
-    )
 
     item_out = txt_path.with_name(f"{base_name}_item.json")
     item_payload = None
     if item_out.exists() and not overwrite:
         try:
-            item_payload = json.loads(item_out.read_text(encoding="utf-8"))
-        except Exception:
+            item_payload = read_json(item_out)
+        except (OSError, ValueError):
             item_payload = None
 
     if item_payload is None:
-        item_path = _extract_items_for_file(
+        # Build the items from the submission already loaded above (its HTML
+        # saved once) and use the returned payload directly, instead of
+        # re-splitting the .txt and re-reading the *_item.json just written.
+        item_payload = _build_item_output(
             txt_path=txt_path,
             filing_dir=filing_dir,
             parser=parser,
             item_extractor=item_extractor,
             overwrite=overwrite,
-            save_html=save_html,
+            save_html=False,
             save_images=save_images,
+            ticker_map=ticker_map,
+            context=context,
         )
-        if not item_path or not item_path.exists():
+        if item_payload is None:
             return None
-        item_payload = json.loads(item_path.read_text(encoding="utf-8"))
-    elif save_images:
-        _save_item_images(
+    else:
+        # _build_item_output already records tickers on the other branch.
+        _record_filing_tickers(
             txt_path=txt_path,
-            extracted=item_payload.get("items", {}),
-            document_lookup=context["document_lookup"],
-            overwrite=overwrite,
+            meta=context["meta"],
+            html_content=str(context["html_content"]),
+            ticker_map=ticker_map,
         )
+        if save_images:
+            _save_item_images(
+                txt_path=txt_path,
+                extracted=item_payload.get("items", {}),
+                document_lookup=context["document_lookup"],
+                overwrite=overwrite,
+            )
 
     structures = {}
     for item_num, item_data in item_payload.get("items", {}).items():
@@ -419,10 +551,65 @@ def _extract_structure_for_file(
         "structures": structures,
     }
     if overwrite or not str_out.exists():
-        str_out.write_text(json.dumps(out, indent=2), encoding="utf-8")
+        write_json(str_out, out)
     return str_out
 
 
+# Per-process parser/extractor instances, created by _init_worker.
+_WORKER_STATE: Dict[str, object] = {}
+
+
+def _init_worker() -> None:
+    # Parser/extractor modules pull in bs4 and lxml; load them only once a
+    # run is actually starting (not for --help or argument errors).
+    from src.extractor import ItemExtractor
+    from src.parser import SECParser
+    from src.structure_extractor import StructureExtractor
+
+    _WORKER_STATE["parser"] = SECParser()
+    _WORKER_STATE["item_extractor"] = ItemExtractor()
+    _WORKER_STATE["structure_extractor"] = StructureExtractor()
+
+
+def _process_submission(
+    txt_path: Path,
+    *,
+    filing_dir: Path,
+    task: str,
+    overwrite: bool,
+    save_html: bool,
+    save_images: bool,
+) -> tuple[Optional[Path], Dict[tuple[str, str], Dict[str, str]]]:
+    """Process one submission; returns (output path, ticker map rows to merge)."""
+    # Ticker rows are buffered per task and merged into the run's map on the
+    # main thread/process, so workers never share the CSV or its cache.
+    ticker_rows = _CikTickerMapCache()
+    if task == "item":
+        out = _extract_items_for_file(
+            txt_path=txt_path,
+            filing_dir=filing_dir,
+            parser=_WORKER_STATE["parser"],
+            item_extractor=_WORKER_STATE["item_extractor"],
+            overwrite=overwrite,
+            save_html=save_html,
+            save_images=save_images,
+            ticker_map=ticker_rows,
+        )
+    else:
+        out = _extract_structure_for_file(
+            txt_path=txt_path,
+            filing_dir=filing_dir,
+            parser=_WORKER_STATE["parser"],
+            item_extractor=_WORKER_STATE["item_extractor"],
+            structure_extractor=_WORKER_STATE["structure_extractor"],
+            overwrite=overwrite,
+            save_html=save_html,
+            save_images=save_images,
+            ticker_map=ticker_rows,
+        )
+    return out, ticker_rows.rows
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Extract items or structures from downloaded SEC submission text files.")
     parser.add_argument("--cik", nargs="+", dest="ciks", default=None, help="CIK folder filter(s).")
@@ -439,18 +626,25 @@ def main() -> None:
         default=25,
         help="Print progress every N filings (default: 25).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of filings processed concurrently (default: 1).",
+    )
+    parser.add_argument(
+        "--processes",
+        action="store_true",
+        help="Run --workers as separate processes so CPU-bound parsing uses multiple cores.",
+    )
     args = parser.parse_args()
 
     filing_dir = Path(args.filing_dir)
     if not filing_dir.exists() or not filing_dir.is_dir():
         raise FileNotFoundError(f"filing_dir not found: {filing_dir}")
 
-    sec_parser = SECParser()
-    item_extractor = ItemExtractor()
-    structure_extractor = StructureExtractor()
-
     target_ciks = _resolve_ciks_from_args(filing_dir, args.ciks)
-    year_filter = {str(y).strip() for y in (args.years or []) if str(y).strip()}
+    year_filter = {y for y in map(str.strip, args.years or []) if y}
 
     submission_files = _list_filing_files(
         filing_dir,
@@ -460,47 +654,57 @@ def main() -> None:
     )
     print(f"Found filings: {len(submission_files)}")
 
+    process = partial(
+        _process_submission,
+        filing_dir=filing_dir,
+        task=args.task,
+        overwrite=args.overwrite,
+        save_html=args.html,
+        save_images=args.image,
+    )
+
     done = 0
     skipped = 0
     started_at = time.time()
     total = len(submission_files)
-    for i, txt_file in enumerate(submission_files, start=1):
-        if args.task == "item":
-            out = _extract_items_for_file(
-                txt_path=txt_file,
-                filing_dir=filing_dir,
-                parser=sec_parser,
-                item_extractor=item_extractor,
-                overwrite=args.overwrite,
-                save_html=args.html,
-                save_images=args.image,
-            )
-        else:
-            out = _extract_structure_for_file(
-                txt_path=txt_file,
-                filing_dir=filing_dir,
-                parser=sec_parser,
-                item_extractor=item_extractor,
-                structure_extractor=structure_extractor,
-                overwrite=args.overwrite,
-                save_html=args.html,
-                save_images=args.image,
-            )
-        if out:
-            done += 1
-        else:
-            skipped += 1
-
-        if total > 0 and (i == 1 or i % max(args.progress_every, 1) == 0 or i == total):
-            elapsed = time.time() - started_at
-            rate = i / elapsed if elapsed > 0 else 0.0
-            remaining = (total - i) / rate if rate > 0 else 0.0
-            print(
-                f"Progress {i}/{total} ({(i/total)*100:.1f}%) "
-                f"done={done} skipped={skipped} "
-                f"elapsed={elapsed/60:.1f}m eta={remaining/60:.1f}m",
-                flush=True,
-            )
+    workers = max(args.workers, 1)
+    executor = None
+    if workers > 1 and args.processes:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+    else:
+        _init_worker()
+        if workers > 1:
+            executor = ThreadPoolExecutor(max_workers=workers)
+    if executor is not None:
+        futures = [executor.submit(process, f) for f in submission_files]
+        results = (fut.result() for fut in as_completed(futures))
+    else:
+        results = (process(f) for f in submission_files)
+
+    ticker_map = _CikTickerMapCache(filing_dir / "_meta" / "cik_ticker_map.csv")
+    try:
+        for i, (out, ticker_rows) in enumerate(results, start=1):
+            ticker_map.merge(ticker_rows)
+            if out:
+                done += 1
+            else:
+                skipped += 1
+
+            if total > 0 and (i == 1 or i % max(args.progress_every, 1) == 0 or i == total):
+                elapsed = time.time() - started_at
+                rate = i / elapsed if elapsed > 0 else 0.0
+                remaining = (total - i) / rate if rate > 0 else 0.0
+                print(
+                    f"Progress {i}/{total} ({(i/total)*100:.1f}%) "
+                    f"done={done} skipped={skipped} "
+                    f"elapsed={elapsed/60:.1f}m eta={remaining/60:.1f}m",
+                    flush=True,
+                )
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        # Written once per run; also keeps partial progress on interrupt.
+        ticker_map.flush()
 
     print(f"Completed. done={done} skipped={skipped}")
 
@@ -8,19 +8,24 @@ Produces per-year markdown reports under stats/:
 from __future__ import annotations
 
 import argparse
+import io
 import json
+import os
 import re
 import sys
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from script.config import ITEMS_10K, ITEMS_10Q
+from src.json_utils import loads_json
 
 
 EXPECTED_ITEMS_BY_FILING: Dict[str, Set[str]] = {
@@ -29,6 +34,15 @@ EXPECTED_ITEMS_BY_FILING: Dict[str, Set[str]] = {
     "10-Q": set(ITEMS_10Q.keys()),
     "10-QA": set(ITEMS_10Q.keys()),
 }
+_NO_EXPECTED_ITEMS: FrozenSet[str] = frozenset()
+
+# Row formatters for the long report tables; binding str.format once saves
+# the method lookup on every row.
+_COVERAGE_ROW = "| {} | {} | {}/{} | {:.2f} | {:.2f} | {} | {} | {} |\n".format
+_STRUCTURE_ROW = (
+    "| {} | {} | {} | {:.2f} | {} | {} | {:.2f} | {} | {} | {:.2f} | {} | {} | {:.2f} | {} | {} |\n".format
+)
+_MISSING_TOC_ROW = "| {} | {} | {} |\n".format
 
 
 def _safe_int_year(text: str) -> Optional[int]:
@@ -36,7 +50,30 @@ def _safe_int_year(text: str) -> Optional[int]:
 
 
 def _word_count(text: str) -> int:
-    return len([w for w in re.split(r"\s+", (text or "").strip()) if w])
+    # str.split() with no separator splits on the same Unicode whitespace
+    # as re's \s and drops empty fields.
+    return len((text or "").split())
+
+
+def _item_sort_key(item: str) -> Tuple[int, int, str]:
+    m = re.match(r'^(\d+)([a-zA-Z]?)$', item)
+    if not m:
+        return (9999, 0, item)
+    num = int(m.group(1))
+    suffix = m.group(2).upper()
+    suffix_rank = (ord(suffix) - ord('A') + 1) if suffix else 0
+    return (num, suffix_rank, item)
+
+
+def _rows_by_year(stats: dict) -> Dict[int, list]:
+    """
+    Sort (year, filing, item)-keyed stats once and bucket them by year.
+    Row order within a year is (filing, item number/suffix).
+    """
+    by_year: Dict[int, list] = defaultdict(list)
+    for key_val in sorted(stats.items(), key=lambda x: (x[0][0], x[0][1], _item_sort_key(x[0][2]))):
+        by_year[key_val[0][0]].append(key_val)
+    return by_year
 
 
 def _walk_structure(nodes: List[dict]) -> Tuple[int, int, int]:
@@ -48,400 +85,573 @@ def _walk_structure(nodes: List[dict]) -> Tuple[int, int, int]:
     body_count = 0
     max_depth = 0
     stack = list(nodes or [])
+    stack_pop = stack.pop
+    stack_extend = stack.extend
     while stack:
-        node = stack.pop()
-        if node.get("type") == "heading":
+        node = stack_pop()
+        try:
+            # StructureExtractor always emits all four keys; subscripting
+            # skips the per-call default handling of dict.get().
+            node_type = node["type"]
+            layer = node["layer"]
+            body = node["body"]
+            children = node["children"]
+        except KeyError:
+            node_type = node.get("type")
+            layer = node.get("layer")
+            body = node.get("body")
+            children = node.get("children")
+        if node_type == "heading":
             heading_count += 1
-            max_depth = max(max_depth, int(node.get("layer") or 0))
-        if (node.get("body") or "").strip():
+            layer = int(layer or 0)
+            if layer > max_depth:
+                max_depth = layer
+        if body and body.strip():
             body_count += 1
-        stack.extend(node.get("children") or [])
+        if children:
+            stack_extend(children)
     return heading_count, body_count, max_depth
 
 
+def _scan_dir(path: str) -> List[os.DirEntry]:
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
 def _iter_filing_submissions(root: Path, years: Optional[Set[int]] = None):
     # root/{cik}/{year}/{filing}/{base}.txt
-    for cik_dir in root.iterdir():
-        if not cik_dir.is_dir() or not cik_dir.name.isdigit():
+    # DirEntry.is_dir()/is_file() reuse the d_type from the directory read,
+    # so the walk does not stat every entry.
+    for cik_entry in _scan_dir(str(root)):
+        if not cik_entry.name.isdigit() or not cik_entry.is_dir():
             continue
-        cik = cik_dir.name
-        for year_dir in cik_dir.iterdir():
-            if not year_dir.is_dir():
+        cik = cik_entry.name
+        for year_entry in _scan_dir(cik_entry.path):
+            if not year_entry.is_dir():
                 continue
-            year = _safe_int_year(year_dir.name)
+            year = _safe_int_year(year_entry.name)
             if year is None:
                 continue
             if years and year not in years:
                 continue
-            for filing_dir in year_dir.iterdir():
-                if not filing_dir.is_dir():
+            for filing_entry in _scan_dir(year_entry.path):
+                if not filing_entry.is_dir():
                     continue
-                filing = filing_dir.name.upper()
-                for submission_path in filing_dir.iterdir():
-                    if submission_path.is_file() and submission_path.suffix.lower() == ".txt":
-                        yield cik, year, filing, submission_path
-
-
-def _load_json(path: Path) -> Optional[dict]:
-    if not path.exists():
+                filing = filing_entry.name.upper()
+                # One listing serves both the .txt lookup and the
+                # *_meta/_item/_str.json sibling checks.
+                entries = _scan_dir(filing_entry.path)
+                names = frozenset(e.name for e in entries)
+                for entry in entries:
+                    if os.path.splitext(entry.name)[1].lower() == ".txt" and entry.is_file():
+                        yield cik, year, filing, filing_entry.path, entry.name, names
+
+
+def _load_json(path: str) -> Optional[dict]:
+    # Missing files surface as OSError; callers skip names they know are absent.
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except OSError:
         return None
     try:
-        return json.loads(path.read_text(encoding="utf-8", errors="ignore"))
-    except Exception:
+        # orjson (when installed) parses the bytes directly, no decode pass.
+        return loads_json(raw)
+    except ValueError:
+        pass
+    try:
+        # Rare files with invalid UTF-8 (or NaN-style literals orjson rejects):
+        # keep the lenient stdlib behaviour.
+        return json.loads(raw.decode("utf-8", errors="ignore"))
+    except ValueError:
         return None
 
 
-def build_report(folder: Path, years: Optional[Set[int]] = None) -> List[Path]:
+@dataclass
+class FilingStats:
+    """Per-filing report inputs, computed independently and merged by build_report."""
+
+    cik: str
+    year: int
+    filing: str
+    submission_name: str
+    has_ticker: bool = False
+    str_json_present: bool = False
+    item_json_present: bool = False
+    toc_items: int = 0
+    toc_anchors: int = 0
+    # (item, word count) for every extracted item, in payload order
+    item_words: List[Tuple[str, int]] = field(default_factory=list)
+    # (item, error) for items that recorded an extraction error
+    item_errors: List[Tuple[str, str]] = field(default_factory=list)
+    missing_items: List[str] = field(default_factory=list)
+    # (item, heading count, body count, max depth) per structure item
+    structures: List[Tuple[str, int, int, int]] = field(default_factory=list)
+
+
+def _process_filing(entry: Tuple[str, int, str, str, str, FrozenSet[str]]) -> FilingStats:
+    cik, year, filing, filing_dir, submission_name, names = entry
+    fs = FilingStats(cik=cik, year=year, filing=filing, submission_name=submission_name)
+
+    # Sibling paths are plain string joins on the scanned directory; no
+    # pathlib objects on the per-filing path.
+    base = os.path.splitext(submission_name)[0]
+    meta_name = f"{base}_meta.json"
+    item_name = f"{base}_item.json"
+    str_name = f"{base}_str.json"
+
+    meta_payload = (_load_json(os.path.join(filing_dir, meta_name)) if meta_name in names else None) or {}
+    tickers = meta_payload.get("ticker_symbols") or []
+    fs.has_ticker = isinstance(tickers, list) and any(str(t).strip() for t in tickers)
+
+    fs.str_json_present = str_name in names
+
+    item_payload = _load_json(os.path.join(filing_dir, item_name)) if item_name in names else None
+    if not item_payload:
+        return fs
+    fs.item_json_present = True
+
+    toc_items = item_payload.get("toc_items", {}) or {}
+    items = item_payload.get("items", {}) or {}
+
+    fs.toc_items = len(toc_items)
+    fs.toc_anchors = sum(1 for v in toc_items.values() if isinstance(v, dict) and v.get("anchor"))
+
+    expected = EXPECTED_ITEMS_BY_FILING.get(filing, _NO_EXPECTED_ITEMS)
+    if expected:
+        fs.missing_items = sorted(expected.difference(items))
+
+    # One pass over the items reads the only two fields the report uses
+    # (error, text_content).
+    for item_num, payload in items.items():
+        if isinstance(payload, dict) and payload.get("error"):
+            fs.item_errors.append((item_num, str(payload.get("error"))))
+        text_content = (payload or {}).get("text_content") or ""
+        fs.item_words.append((item_num, _word_count(text_content)))
+
+    str_payload = _load_json(os.path.join(filing_dir, str_name)) if fs.str_json_present else None
+    if str_payload:
+        structures = (str_payload.get("structures") or {})
+        for item_num, nodes in structures.items():
+            fs.structures.append((item_num, *_walk_structure(nodes or [])))
+    return fs
+
+
+class YearStats:
+    """Year-level counters behind the summary tables, merged from FilingStats."""
+
+    __slots__ = (
+        'filings_total', 'filings_toc_found', 'filings_toc_missing',
+        'filings_with_ticker', 'filings_with_any_extracted_items', 'item_json_present',
+        'item_json_missing', 'str_json_present', 'toc_items_sum', 'toc_anchors_sum',
+        'extracted_items_sum', 'filings_with_item_errors',
+        'filings_missing_expected_items',
+    )
+
+    def __init__(self):
+        self.filings_total: int = 0
+        self.filings_toc_found: int = 0
+        self.filings_toc_missing: int = 0
+        self.filings_with_ticker: int = 0
+        self.filings_with_any_extracted_items: int = 0
+        self.item_json_present: int = 0
+        self.item_json_missing: int = 0
+        self.str_json_present: int = 0
+        self.toc_items_sum: int = 0
+        self.toc_anchors_sum: int = 0
+        self.extracted_items_sum: int = 0
+        self.filings_with_item_errors: int = 0
+        self.filings_missing_expected_items: int = 0
+
+
+class ItemLengths:
+    """Word-count aggregate for one (year, filing, item); min/max are set by the first sample."""
+
+    __slots__ = ('count', 'total_words', 'min_words', 'max_words')
+
+    def __init__(self):
+        self.count: int = 0
+        self.total_words: int = 0
+        self.min_words: int = 0
+        self.max_words: int = 0
+
+
+class StructureStats:
+    """Heading/body/depth aggregates for one (year, filing, item) across filings."""
+
+    __slots__ = (
+        'count', 'head_sum', 'head_min', 'head_max', 'body_sum', 'body_min', 'body_max',
+        'depth_sum', 'depth_min', 'depth_max', 'ratio_sum', 'ratio_min', 'ratio_max',
+    )
+
+    def __init__(self):
+        self.count: int = 0
+        self.head_sum: int = 0
+        self.head_min: Optional[int] = None
+        self.head_max: Optional[int] = None
+        self.body_sum: int = 0
+        self.body_min: Optional[int] = None
+        self.body_max: Optional[int] = None
+        self.depth_sum: int = 0
+        self.depth_min: Optional[int] = None
+        self.depth_max: Optional[int] = None
+        self.ratio_sum: float = 0.0
+        self.ratio_min: Optional[float] = None
+        self.ratio_max: Optional[float] = None
+
+
+def _merge_filing_stats(
+    fs: FilingStats,
+    *,
+    year_stats,
+    item_coverage,
+    item_lengths,
+    filing_counts,
+    filing_toc_found_counts,
+    item_errors,
+    missing_expected,
+    missing_toc,
+    structure_stats,
+) -> None:
+    cik, year, filing = fs.cik, fs.year, fs.filing
+    y = year_stats[year]
+    y.filings_total += 1
+    filing_counts[(year, filing)] += 1
+    if fs.has_ticker:
+        y.filings_with_ticker += 1
+    if fs.str_json_present:
+        y.str_json_present += 1
+
+    if not fs.item_json_present:
+        y.item_json_missing += 1
+        y.filings_toc_missing += 1
+        missing_toc[year].append((cik, filing, fs.submission_name))
+        return
+
+    y.item_json_present += 1
+    y.filings_toc_found += 1
+    filing_toc_found_counts[(year, filing)] += 1
+    y.toc_items_sum += fs.toc_items
+    y.toc_anchors_sum += fs.toc_anchors
+    y.extracted_items_sum += len(fs.item_words)
+    if fs.item_words:
+        y.filings_with_any_extracted_items += 1
+    if fs.missing_items:
+        y.filings_missing_expected_items += 1
+        missing_expected[year].append((cik, filing, ", ".join(fs.missing_items)))
+
+    for item_num, err in fs.item_errors:
+        item_errors[year].append((cik, filing, item_num, err))
+    if fs.item_errors:
+        y.filings_with_item_errors += 1
+
+    for item_num, words in fs.item_words:
+        item_coverage[(year, filing, item_num)] += 1
+        agg = item_lengths[(year, filing, item_num)]
+        if agg.count:
+            if words < agg.min_words:
+                agg.min_words = words
+            elif words > agg.max_words:
+                agg.max_words = words
+        else:
+            agg.min_words = agg.max_words = words
+        agg.count += 1
+        agg.total_words += words
+
+    for item_num, head_cnt, body_cnt, depth in fs.structures:
+        ratio = (head_cnt / body_cnt) if body_cnt else float("inf")
+        s = structure_stats[(year, filing, item_num)]
+        s.count += 1
+        s.head_sum += head_cnt
+        s.head_min = head_cnt if s.head_min is None else min(s.head_min, head_cnt)
+        s.head_max = head_cnt if s.head_max is None else max(s.head_max, head_cnt)
+        s.body_sum += body_cnt
+        s.body_min = body_cnt if s.body_min is None else min(s.body_min, body_cnt)
+        s.body_max = body_cnt if s.body_max is None else max(s.body_max, body_cnt)
+        s.depth_sum += depth
+        s.depth_min = depth if s.depth_min is None else min(s.depth_min, depth)
+        s.depth_max = depth if s.depth_max is None else max(s.depth_max, depth)
+        s.ratio_sum += ratio if ratio != float("inf") else 0.0
+        if ratio != float("inf"):
+            s.ratio_min = ratio if s.ratio_min is None else min(s.ratio_min, ratio)
+            s.ratio_max = ratio if s.ratio_max is None else max(s.ratio_max, ratio)
+
+
+def build_report(
+    folder: Path,
+    years: Optional[Set[int]] = None,
+    workers: int = 1,
+    io_threads: int = 1,
+) -> List[Path]:
     stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     stats_dir = Path("stats")
     stats_dir.mkdir(parents=True, exist_ok=True)
 
     # Year-level aggregates
-    year_stats = defaultdict(lambda: {
-        "filings_total": 0,
-        "filings_toc_found": 0,
-        "filings_toc_missing": 0,
-        "filings_with_ticker": 0,
-        "filings_with_any_extracted_items": 0,
-        "item_json_present": 0,
-        "item_json_missing": 0,
-        "str_json_present": 0,
-        "toc_items_sum": 0,
-        "toc_anchors_sum": 0,
-        "extracted_items_sum": 0,
-        "filings_with_item_errors": 0,
-        "filings_missing_expected_items": 0,
-    })
+    year_stats: Dict[int, YearStats] = defaultdict(YearStats)
 
     # (year, filing, item) -> count of filings where item was extracted
     item_coverage = defaultdict(int)
-    # (year, filing, item) -> [count, sum_words, min_words, max_words]
-    item_lengths = defaultdict(lambda: [0, 0, None, None])
+    # (year, filing, item) -> word-count aggregate
+    item_lengths: Dict[Tuple[int, str, str], ItemLengths] = defaultdict(ItemLengths)
     # (year, filing) -> filings count
     filing_counts = defaultdict(int)
     # (year, filing) -> filings where TOC was found (proxy: item json exists)
     filing_toc_found_counts = defaultdict(int)
 
-    # Track extra items (outside expected set)
-    extra_items = defaultdict(set)  # (year, filing) -> set[item]
-
     # Detailed issue tracking
     item_errors = defaultdict(list)  # year -> list of (cik, filing, item, error)
     missing_expected = defaultdict(list)  # year -> list of (cik, filing, missing_items)
     missing_toc = defaultdict(list)  # year -> list of (cik, filing, html_name)
 
     # Structure stats per item
-    structure_stats = defaultdict(lambda: {
-        "count": 0,
-        "head_sum": 0,
-        "head_min": None,
-        "head_max": None,
-        "body_sum": 0,
-        "body_min": None,
-        "body_max": None,
-        "depth_sum": 0,
-        "depth_min": None,
-        "depth_max": None,
-        "ratio_sum": 0.0,
-        "ratio_min": None,
-        "ratio_max": None,
-    })
+    structure_stats: Dict[Tuple[int, str, str], StructureStats] = defaultdict(StructureStats)
 
     submission_list = list(_iter_filing_submissions(folder, years=years))
     total_submissions = len(submission_list)
 
-    for idx, (cik, year, filing, submission_path) in enumerate(submission_list, start=1):
-        y = year_stats[year]
-        y["filings_total"] += 1
-        filing_counts[(year, filing)] += 1
-
-        base = submission_path.stem
-        meta_path = submission_path.with_name(f"{base}_meta.json")
-        item_path = submission_path.with_name(f"{base}_item.json")
-        str_path = submission_path.with_name(f"{base}_str.json")
-
-        meta_payload = _load_json(meta_path) or {}
-        tickers = meta_payload.get("ticker_symbols") or []
-        if isinstance(tickers, list) and any(str(t).strip() for t in tickers):
-            y["filings_with_ticker"] += 1
-
-        if str_path.exists():
-            y["str_json_present"] += 1
-
-        item_payload = _load_json(item_path)
-        if not item_payload:
-            y["item_json_missing"] += 1
-            y["filings_toc_missing"] += 1
-            missing_toc[year].append((cik, filing, submission_path.name))
-            continue
+    if workers > 1 and total_submissions > 1:
+        # JSON decoding and structure walks are CPU-bound and independent per
+        # filing; map() keeps submission order so list-valued outputs match
+        # a serial run.
+        executor = ProcessPoolExecutor(max_workers=workers)
+        results = executor.map(_process_filing, submission_list, chunksize=64)
+    elif io_threads > 1 and total_submissions > 1:
+        # In a single process, threads overlap one filing's file reads (which
+        # release the GIL) with another filing's JSON decoding.
+        executor = ThreadPoolExecutor(max_workers=io_threads)
+        results = executor.map(_process_filing, submission_list)
+    else:
+        executor = None
+        results = map(_process_filing, submission_list)
 
-        y["item_json_present"] += 1
-        y["filings_toc_found"] += 1
-        filing_toc_found_counts[(year, filing)] += 1
-
-        toc_items = item_payload.get("toc_items", {}) or {}
-        items = item_payload.get("items", {}) or {}
-
-        y["toc_items_sum"] += len(toc_items)
-        y["toc_anchors_sum"] += sum(1 for v in toc_items.values() if isinstance(v, dict) and v.get("anchor"))
-        y["extracted_items_sum"] += len(items)
-
-        expected = EXPECTED_ITEMS_BY_FILING.get(filing, set())
-        extracted_item_nums = {k for k in items.keys()}
-        if extracted_item_nums:
-            y["filings_with_any_extracted_items"] += 1
-
-        had_error = False
-        for item_num, payload in items.items():
-            if isinstance(payload, dict) and payload.get("error"):
-                had_error = True
-                item_errors[year].append((cik, filing, item_num, str(payload.get("error"))))
-        if had_error:
-            y["filings_with_item_errors"] += 1
-
-        if expected:
-            missing = sorted(expected - extracted_item_nums)
-            if missing:
-                y["filings_missing_expected_items"] += 1
-                missing_expected[year].append((cik, filing, ", ".join(missing)))
-
-        for item_num in extracted_item_nums:
-            item_coverage[(year, filing, item_num)] += 1
-            text_content = (items.get(item_num) or {}).get("text_content") or ""
-            words = _word_count(text_content)
-            agg = item_lengths[(year, filing, item_num)]
-            agg[0] += 1
-            agg[1] += words
-            agg[2] = words if agg[2] is None else min(agg[2], words)
-            agg[3] = words if agg[3] is None else max(agg[3], words)
-            if expected and item_num not in expected:
-                extra_items[(year, filing)].add(item_num)
-
-        str_payload = _load_json(str_path)
-        if str_payload:
-            structures = (str_payload.get("structures") or {})
-            for item_num, nodes in structures.items():
-                head_cnt, body_cnt, depth = _walk_structure(nodes or [])
-                ratio = (head_cnt / body_cnt) if body_cnt else float("inf")
-                s = structure_stats[(year, filing, item_num)]
-                s["count"] += 1
-                s["head_sum"] += head_cnt
-                s["head_min"] = head_cnt if s["head_min"] is None else min(s["head_min"], head_cnt)
-                s["head_max"] = head_cnt if s["head_max"] is None else max(s["head_max"], head_cnt)
-                s["body_sum"] += body_cnt
-                s["body_min"] = body_cnt if s["body_min"] is None else min(s["body_min"], body_cnt)
-                s["body_max"] = body_cnt if s["body_max"] is None else max(s["body_max"], body_cnt)
-                s["depth_sum"] += depth
-                s["depth_min"] = depth if s["depth_min"] is None else min(s["depth_min"], depth)
-                s["depth_max"] = depth if s["depth_max"] is None else max(s["depth_max"], depth)
-                s["ratio_sum"] += ratio if ratio != float("inf") else 0.0
-                if ratio != float("inf"):
-                    s["ratio_min"] = ratio if s["ratio_min"] is None else min(s["ratio_min"], ratio)
-                    s["ratio_max"] = ratio if s["ratio_max"] is None else max(s["ratio_max"], ratio)
-
-        if idx % 100 == 0 or idx == total_submissions:
-            pct = (idx / total_submissions * 100.0) if total_submissions else 100.0
-            print(f"[stat] processed {idx}/{total_submissions} filings ({pct:.1f}%)")
+    try:
+        for idx, fs in enumerate(results, start=1):
+            _merge_filing_stats(
+                fs,
+                year_stats=year_stats,
+                item_coverage=item_coverage,
+                item_lengths=item_lengths,
+                filing_counts=filing_counts,
+                filing_toc_found_counts=filing_toc_found_counts,
+                item_errors=item_errors,
+                missing_expected=missing_expected,
+                missing_toc=missing_toc,
+                structure_stats=structure_stats,
+            )
+
+            if idx % 100 == 0 or idx == total_submissions:
+                pct = (idx / total_submissions * 100.0) if total_submissions else 100.0
+                print(f"[stat] processed {idx}/{total_submissions} filings ({pct:.1f}%)")
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    # Extra items (outside the expected set) are derived once from the
+    # coverage keys, which already hold every extracted (year, filing, item).
+    extra_items = defaultdict(set)  # (year, filing) -> set[item]
+    for yy, filing, item in item_coverage:
+        expected = EXPECTED_ITEMS_BY_FILING.get(filing, _NO_EXPECTED_ITEMS)
+        if expected and item not in expected:
+            extra_items[(yy, filing)].add(item)
 
     # Overall summary markdown (previous extraction_performance style)
     overall_path = stats_dir / f"extraction_stat_overall_{stamp}.md"
-    overall_lines: List[str] = []
-    overall_lines.append("# Extraction Performance Report (Overall)")
-    overall_lines.append("")
-    overall_lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    overall_lines.append(f"Source folder: `{folder}`")
-    overall_lines.append("")
-    overall_lines.append("## Yearly Summary")
-    overall_lines.append("")
-    overall_lines.append("| Year | Filings | With Ticker | Ticker % | TOC Found | TOC Missing | Any Items Extracted | Item JSON | Missing Item JSON | Structure JSON | Avg TOC Items | Avg TOC Anchors | Avg Extracted Items | Filings with Item Errors | Filings Missing Expected Items |")
-    overall_lines.append("|---|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|")
+    buf = io.StringIO()
+    write = buf.write
+    write("# Extraction Performance Report (Overall)\n")
+    write("\n")
+    write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    write(f"Source folder: `{folder}`\n")
+    write("\n")
+    write("## Yearly Summary\n")
+    write("\n")
+    write("| Year | Filings | With Ticker | Ticker % | TOC Found | TOC Missing | Any Items Extracted | Item JSON | Missing Item JSON | Structure JSON | Avg TOC Items | Avg TOC Anchors | Avg Extracted Items | Filings with Item Errors | Filings Missing Expected Items |\n")
+    write("|---|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|\n")
     for year in sorted(year_stats.keys()):
         y = year_stats[year]
-        denom = max(y["item_json_present"], 1)
-        ticker_pct = (y["filings_with_ticker"] / max(y["filings_total"], 1)) * 100.0
-        overall_lines.append(
-            "| {} | {} | {} | {:.2f} | {} | {} | {} | {} | {} | {} | {:.2f} | {:.2f} | {:.2f} | {} | {} |".format(
+        denom = max(y.item_json_present, 1)
+        ticker_pct = (y.filings_with_ticker / max(y.filings_total, 1)) * 100.0
+        write(
+            "| {} | {} | {} | {:.2f} | {} | {} | {} | {} | {} | {} | {:.2f} | {:.2f} | {:.2f} | {} | {} |\n".format(
                 year,
-                y["filings_total"],
-                y["filings_with_ticker"],
+                y.filings_total,
+                y.filings_with_ticker,
                 ticker_pct,
-                y["filings_toc_found"],
-                y["filings_toc_missing"],
-                y["filings_with_any_extracted_items"],
-                y["item_json_present"],
-                y["item_json_missing"],
-                y["str_json_present"],
-                y["toc_items_sum"] / denom,
-                y["toc_anchors_sum"] / denom,
-                y["extracted_items_sum"] / denom,
-                y["filings_with_item_errors"],
-                y["filings_missing_expected_items"],
+                y.filings_toc_found,
+                y.filings_toc_missing,
+                y.filings_with_any_extracted_items,
+                y.item_json_present,
+                y.item_json_missing,
+                y.str_json_present,
+                y.toc_items_sum / denom,
+                y.toc_anchors_sum / denom,
+                y.extracted_items_sum / denom,
+                y.filings_with_item_errors,
+                y.filings_missing_expected_items,
             )
         )
-    overall_path.write_text("\n".join(overall_lines) + "\n", encoding="utf-8")
+    overall_path.write_text(buf.getvalue(), encoding="utf-8")
 
     # Build per-year markdowns
+    # Sorted once for all years instead of re-sorting per year.
+    coverage_by_year = _rows_by_year(item_coverage)
+    structure_by_year = _rows_by_year(structure_stats)
+    # (year, filing) -> (filings, filings with TOC found), looked up once per
+    # coverage row instead of probing both counters.
+    group_counts = {
+        key: (total, filing_toc_found_counts.get(key, 0))
+        for key, total in filing_counts.items()
+    }
     outputs: List[Path] = []
     for year in sorted(year_stats.keys()):
         y = year_stats[year]
-        denom = max(y["item_json_present"], 1)
+        denom = max(y.item_json_present, 1)
         md_path = stats_dir / f"extraction_stat_{year}_{stamp}.md"
-        lines: List[str] = []
-        lines.append("# Extraction Performance Report")
-        lines.append("")
-        lines.append(f"Year: {year}")
-        lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"Source folder: `{folder}`")
-        lines.append("")
-
-        lines.append("## 1. Item Extraction Summary")
-        lines.append("")
-        lines.append("| Filings | With Ticker | Ticker % | TOC Found | TOC Missing | Any Items Extracted | Item JSON | Missing Item JSON | Structure JSON | Avg TOC Items | Avg TOC Anchors | Avg Extracted Items | Filings with Item Errors | Filings Missing Expected Items |")
-        lines.append("|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|")
-        ticker_pct = (y["filings_with_ticker"] / max(y["filings_total"], 1)) * 100.0
-        lines.append(
-            "| {} | {} | {:.2f} | {} | {} | {} | {} | {} | {} | {:.2f} | {:.2f} | {:.2f} | {} | {} |".format(
-                y["filings_total"],
-                y["filings_with_ticker"],
+        # Rows are newline-terminated and appended to one buffer, so the
+        # report is written without a final join over every line.
+        buf = io.StringIO()
+        write = buf.write
+        write("# Extraction Performance Report\n")
+        write("\n")
+        write(f"Year: {year}\n")
+        write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        write(f"Source folder: `{folder}`\n")
+        write("\n")
+
+        write("## 1. Item Extraction Summary\n")
+        write("\n")
+        write("| Filings | With Ticker | Ticker % | TOC Found | TOC Missing | Any Items Extracted | Item JSON | Missing Item JSON | Structure JSON | Avg TOC Items | Avg TOC Anchors | Avg Extracted Items | Filings with Item Errors | Filings Missing Expected Items |\n")
+        write("|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|\n")
+        ticker_pct = (y.filings_with_ticker / max(y.filings_total, 1)) * 100.0
+        write(
+            "| {} | {} | {:.2f} | {} | {} | {} | {} | {} | {} | {:.2f} | {:.2f} | {:.2f} | {} | {} |\n".format(
+                y.filings_total,
+                y.filings_with_ticker,
                 ticker_pct,
-                y["filings_toc_found"],
-                y["filings_toc_missing"],
-                y["filings_with_any_extracted_items"],
-                y["item_json_present"],
-                y["item_json_missing"],
-                y["str_json_present"],
-                y["toc_items_sum"] / denom,
-                y["toc_anchors_sum"] / denom,
-                y["extracted_items_sum"] / denom,
-                y["filings_with_item_errors"],
-                y["filings_missing_expected_items"],
+                y.filings_toc_found,
+                y.filings_toc_missing,
+                y.filings_with_any_extracted_items,
+                y.item_json_present,
+                y.item_json_missing,
+                y.str_json_present,
+                y.toc_items_sum / denom,
+                y.toc_anchors_sum / denom,
+                y.extracted_items_sum / denom,
+                y.filings_with_item_errors,
+                y.filings_missing_expected_items,
             )
         )
 
-        lines.append("")
-        lines.append("## 2. Item Coverage and Lengths")
-        lines.append("")
-        lines.append("Coverage is shown in two ways:")
-        lines.append("")
-        lines.append("X out of Y (TOC) where Y is filings with TOC found for that year+filing.")
-        lines.append("Coverage % (Total) where denominator is all filings for that year+filing.")
-        lines.append("")
-        lines.append("| Filing | Item | X out of Y (TOC) | Coverage % (TOC Found) | Coverage % (Total) | Avg Words | Min Words | Max Words |")
-        lines.append("|---|---|---|---:|---:|---:|---:|---:|")
-        def _item_sort_key(item: str) -> Tuple[int, int, str]:
-            m = re.match(r'^(\d+)([a-zA-Z]?)$', item)
-            if not m:
-                return (9999, 0, item)
-            num = int(m.group(1))
-            suffix = m.group(2).upper()
-            suffix_rank = (ord(suffix) - ord('A') + 1) if suffix else 0
-            return (num, suffix_rank, item)
-
-        for (yy, filing, item), count in sorted(
-            item_coverage.items(),
-            key=lambda x: (x[0][0], x[0][1], _item_sort_key(x[0][2])),
-        ):
-            if yy != year:
-                continue
-            total = filing_counts.get((yy, filing), 0)
-            toc_found = filing_toc_found_counts.get((yy, filing), 0)
+        write("\n")
+        write("## 2. Item Coverage and Lengths\n")
+        write("\n")
+        write("Coverage is shown in two ways:\n")
+        write("\n")
+        write("X out of Y (TOC) where Y is filings with TOC found for that year+filing.\n")
+        write("Coverage % (Total) where denominator is all filings for that year+filing.\n")
+        write("\n")
+        write("| Filing | Item | X out of Y (TOC) | Coverage % (TOC Found) | Coverage % (Total) | Avg Words | Min Words | Max Words |\n")
+        write("|---|---|---|---:|---:|---:|---:|---:|\n")
+        for (yy, filing, item), count in coverage_by_year.get(year, ()):
+            total, toc_found = group_counts.get((yy, filing), (0, 0))
             pct_total = (count / total * 100.0) if total else 0.0
             pct_toc = (count / toc_found * 100.0) if toc_found else 0.0
             agg = item_lengths[(yy, filing, item)]
-            avg_words = round(agg[1] / max(agg[0], 1), 2)
-            lines.append(
-                f"| {filing} | {item} | {count}/{toc_found} | {pct_toc:.2f} | {pct_total:.2f} | {avg_words} | {agg[2] or 0} | {agg[3] or 0} |"
+            avg_words = round(agg.total_words / max(agg.count, 1), 2)
+            write(
+                _COVERAGE_ROW(
+                    filing, item, count, toc_found, pct_toc, pct_total, avg_words, agg.min_words, agg.max_words
+                )
             )
 
-        lines.append("")
-        lines.append("## 3. Structure Extraction Stats")
-        lines.append("")
-        lines.append("| Filing | Item | Filings | Avg Headings | Min | Max | Avg Bodies | Min | Max | Avg Depth | Min | Max | Avg H/B | Min | Max |")
-        lines.append("|---|---|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|")
-        for (yy, filing, item), s in sorted(
-            structure_stats.items(),
-            key=lambda x: (x[0][0], x[0][1], _item_sort_key(x[0][2])),
-        ):
-            if yy != year:
-                continue
-            count = max(s["count"], 1)
-            lines.append(
-                "| {} | {} | {} | {:.2f} | {} | {} | {:.2f} | {} | {} | {:.2f} | {} | {} | {:.2f} | {} | {} |".format(
+        write("\n")
+        write("## 3. Structure Extraction Stats\n")
+        write("\n")
+        write("| Filing | Item | Filings | Avg Headings | Min | Max | Avg Bodies | Min | Max | Avg Depth | Min | Max | Avg H/B | Min | Max |\n")
+        write("|---|---|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|---:|\n")
+        for (yy, filing, item), s in structure_by_year.get(year, ()):
+            count = max(s.count, 1)
+            write(
+                _STRUCTURE_ROW(
                     filing,
                     item,
-                    s["count"],
-                    s["head_sum"] / count,
-                    s["head_min"] or 0,
-                    s["head_max"] or 0,
-                    s["body_sum"] / count,
-                    s["body_min"] or 0,
-                    s["body_max"] or 0,
-                    s["depth_sum"] / count,
-                    s["depth_min"] or 0,
-                    s["depth_max"] or 0,
-                    (s["ratio_sum"] / count) if s["count"] else 0.0,
-                    round(s["ratio_min"], 2) if s["ratio_min"] is not None else 0.0,
-                    round(s["ratio_max"], 2) if s["ratio_max"] is not None else 0.0,
+                    s.count,
+                    s.head_sum / count,
+                    s.head_min or 0,
+                    s.head_max or 0,
+                    s.body_sum / count,
+                    s.body_min or 0,
+                    s.body_max or 0,
+                    s.depth_sum / count,
+                    s.depth_min or 0,
+                    s.depth_max or 0,
+                    (s.ratio_sum / count) if s.count else 0.0,
+                    round(s.ratio_min, 2) if s.ratio_min is not None else 0.0,
+                    round(s.ratio_max, 2) if s.ratio_max is not None else 0.0,
                 )
             )
 
-        lines.append("")
-        lines.append("## 4. Filings with Item Errors")
-        lines.append("")
-        lines.append("These are per-item extraction errors recorded in `*_item.json`.")
+        write("\n")
+        write("## 4. Filings with Item Errors\n")
+        write("\n")
+        write("These are per-item extraction errors recorded in `*_item.json`.\n")
         if not item_errors.get(year):
-            lines.append("None.")
+            write("None.\n")
         else:
             err_counts = defaultdict(int)
             for _cik, _filing, _item, err in item_errors[year]:
                 err_counts[err] += 1
-            lines.append("| Error | Count |")
-            lines.append("|---|---:|")
+            write("| Error | Count |\n")
+            write("|---|---:|\n")
             for err, cnt in sorted(err_counts.items(), key=lambda x: (-x[1], x[0])):
-                lines.append(f"| {err} | {cnt} |")
+                write(f"| {err} | {cnt} |\n")
 
-        lines.append("")
-        lines.append("## 5. Filings Missing Expected Items")
-        lines.append("")
-        lines.append("Expected item list is from `script/config.py`.")
-        lines.append("Note: filings without TOC are excluded from this count.")
+        write("\n")
+        write("## 5. Filings Missing Expected Items\n")
+        write("\n")
+        write("Expected item list is from `script/config.py`.\n")
+        write("Note: filings without TOC are excluded from this count.\n")
         if not missing_expected.get(year):
-            lines.append("None.")
+            write("None.\n")
         else:
             item_missing_counts = defaultdict(int)
             for _cik, _filing, missing in missing_expected[year]:
                 for item in [s.strip() for s in missing.split(",") if s.strip()]:
                     item_missing_counts[item] += 1
-            lines.append("| Item | Missing Count |")
-            lines.append("|---|---:|")
+            write("| Item | Missing Count |\n")
+            write("|---|---:|\n")
             for item, cnt in sorted(item_missing_counts.items(), key=lambda x: _item_sort_key(x[0])):
-                lines.append(f"| {item} | {cnt} |")
+                write(f"| {item} | {cnt} |\n")
 
-        lines.append("")
-        lines.append("## 6. Filings Missing TOC")
-        lines.append("")
+        write("\n")
+        write("## 6. Filings Missing TOC\n")
+        write("\n")
         if not missing_toc.get(year):
-            lines.append("None.")
+            write("None.\n")
         else:
-            lines.append("| CIK | Filing | HTML |")
-            lines.append("|---|---|---|")
+            write("| CIK | Filing | HTML |\n")
+            write("|---|---|---|\n")
             for cik, filing, html_name in missing_toc[year]:
-                lines.append(f"| {cik} | {filing} | {html_name} |")
+                write(_MISSING_TOC_ROW(cik, filing, html_name))
 
-        lines.append("")
-        lines.append("## 7. Extra Items (Outside Regulated Scope)")
-        lines.append("")
+        write("\n")
+        write("## 7. Extra Items (Outside Regulated Scope)\n")
+        write("\n")
         if not extra_items:
-            lines.append("No extra items found.")
+            write("No extra items found.\n")
         else:
-            lines.append("| Filing | Extra Items |")
-            lines.append("|---|---|")
+            write("| Filing | Extra Items |\n")
+            write("|---|---|\n")
             for (yy, filing), items in sorted(extra_items.items(), key=lambda x: (x[0][0], x[0][1])):
                 if yy != year:
                     continue
-                lines.append(f"| {filing} | {', '.join(sorted(items))} |")
+                write(f"| {filing} | {', '.join(sorted(items))} |\n")
 
-        md_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        md_path.write_text(buf.getvalue(), encoding="utf-8")
         outputs.append(md_path)
 
     outputs.append(overall_path)
@@ -452,6 +662,18 @@ def main() -> int:
     parser = argparse.ArgumentParser(description="Generate extraction performance report for current pipeline outputs.")
     parser.add_argument("--folder", default="sec_filings", help="Root filings folder (default: sec_filings)")
     parser.add_argument("--year", nargs="+", type=int, help="Optional year(s) to scope the report")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for parsing filing JSON outputs (default: 1).",
+    )
+    parser.add_argument(
+        "--io-threads",
+        type=int,
+        default=1,
+        help="Threads for overlapping JSON file reads when --workers is 1 (default: 1).",
+    )
     args = parser.parse_args()
 
     folder = Path(args.folder)
@@ -459,7 +681,12 @@ def main() -> int:
         raise FileNotFoundError(f"Folder not found: {folder}")
 
     years = set(args.year) if args.year else None
-    outputs = build_report(folder, years=years)
+    outputs = build_report(
+        folder,
+        years=years,
+        workers=max(args.workers, 1),
+        io_threads=max(args.io_threads, 1),
+    )
     for path in outputs:
         print(f"Report generated: {path}")
     return 0
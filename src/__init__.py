@@ -6,9 +6,28 @@ Extracts specific items from SEC EDGAR 10-K and 10-Q filings.
 __version__ = "1.0.0"
 __author__ = "ItemXtractor Contributors"
 
-from .downloader import SECDownloader
-from .parser import SECParser
-from .extractor import ItemExtractor
-from .file_manager import FileManager
+from importlib import import_module
+
+# Public classes are resolved on first access so that importing a light
+# submodule (e.g. src.submission_parser) does not load requests/bs4/lxml.
+_LAZY_EXPORTS = {
+    'SECDownloader': '.downloader',
+    'SECParser': '.parser',
+    'ItemExtractor': '.extractor',
+    'FileManager': '.file_manager',
+}
 
 __all__ = ['SECDownloader', 'SECParser', 'ItemExtractor', 'FileManager']
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
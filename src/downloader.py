@@ -2,29 +2,67 @@
 SEC EDGAR Downloader - Fetches filings from SEC EDGAR
 """
 
+import os
 import requests
 import time
 import re
-from typing import Optional, Tuple
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
 from bs4 import BeautifulSoup
 from script.config import (
     SEC_BASE_URL, SEC_USER_AGENT, REQUEST_TIMEOUT, REQUEST_DELAY
 )
+from .http_session import create_sec_session
+from .rate_limiter import SEC_RATE_LIMITER, TokenBucket
+from .submission_parser import read_submission_text
 
 
 class SECDownloader:
     """Downloads SEC filings from EDGAR"""
     
-    def __init__(self, user_agent: str = SEC_USER_AGENT):
+    def __init__(
+        self,
+        user_agent: str = SEC_USER_AGENT,
+        session: Optional[requests.Session] = None,
+        cache_dir: Optional[str] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+    ):
         """
         Initialize SECDownloader
         
         Args:
             user_agent: User agent string for SEC requests
+            session: Optional shared session; keeps pooled keep-alive
+                connections across downloader and index requests
+            cache_dir: Optional directory for submission texts keyed by
+                accession number, reused across runs to skip re-downloads
+            rate_limiter: Request limiter; defaults to the process-wide
+                SEC limiter shared with SECIndexParser
         """
         self.user_agent = user_agent
-        self.session = requests.Session()
+        self._owns_session = session is None
+        self.session = session if session is not None else create_sec_session(user_agent)
         self.session.headers.update({'User-Agent': user_agent})
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._ticker_to_cik: Optional[Dict[str, str]] = None
+        self.rate_limiter = rate_limiter if rate_limiter is not None else SEC_RATE_LIMITER
+    
+    def close(self) -> None:
+        """Close the HTTP session if this downloader created it"""
+        if self._owns_session:
+            self.session.close()
+    
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """Rate-limited GET on the shared session"""
+        self.rate_limiter.acquire()
+        return self.session.get(url, timeout=REQUEST_TIMEOUT, **kwargs)
+    
+    def __enter__(self) -> "SECDownloader":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
     
     def _get_cik_from_ticker(self, ticker: str) -> Optional[str]:
         """
@@ -37,20 +75,23 @@ class SECDownloader:
             CIK number (padded to 10 digits) or None if not found
         """
         try:
-            # Use SEC's company tickers JSON endpoint
-            url = f"{SEC_BASE_URL}/files/company_tickers.json"
-            response = self.session.get(url, timeout=REQUEST_TIMEOUT)
-            response.raise_for_status()
-            
-            data = response.json()
-            ticker_upper = ticker.upper()
-            
-            for entry in data.values():
-                if entry.get('ticker', '').upper() == ticker_upper:
-                    cik = str(entry['cik_str']).zfill(10)
-                    return cik
+            if self._ticker_to_cik is None:
+                # Use SEC's company tickers JSON endpoint; fetched once per
+                # downloader instead of once per lookup.
+                url = f"{SEC_BASE_URL}/files/company_tickers.json"
+                response = self._get(url)
+                response.raise_for_status()
+                
+                ticker_to_cik: Dict[str, str] = {}
+                for entry in response.json().values():
+                    # First entry wins, matching the original linear scan.
+                    ticker_to_cik.setdefault(
+                        entry.get('ticker', '').upper(),
+                        str(entry['cik_str']).zfill(10),
+                    )
+                self._ticker_to_cik = ticker_to_cik
             
-            return None
+            return self._ticker_to_cik.get(ticker.upper())
         except Exception as e:
             raise Exception(f"Failed to resolve ticker {ticker}: {str(e)}")
     
@@ -116,8 +157,7 @@ class SECDownloader:
                 'count': '100'
             }
             
-            time.sleep(REQUEST_DELAY)
-            response = self.session.get(browse_url, params=params, timeout=REQUEST_TIMEOUT)
+            response = self._get(browse_url, params=params)
             response.raise_for_status()
             
             # Parse XML/Atom response
@@ -163,9 +203,8 @@ class SECDownloader:
                     # https://www.sec.gov/Archives/edgar/{CIK}/{accession_no_dashes}/{accession_no_with_dashes}-index.html
                     doc_index_url = f"{SEC_BASE_URL}/Archives/edgar/data/{cik_archive}/{accession_path}/{accession_formatted}-index.html"
                     
-                    time.sleep(REQUEST_DELAY)
                     try:
-                        doc_response = self.session.get(doc_index_url, timeout=REQUEST_TIMEOUT)
+                        doc_response = self._get(doc_index_url)
                         
                         if doc_response.status_code == 200:
                             # Parse the index to find the main document
@@ -214,7 +253,7 @@ class SECDownloader:
                                                 else:
                                                     doc_url = f"{SEC_BASE_URL}{href}"
                                                 return doc_url
-                    except:
+                    except Exception:
                         # If index file not found, try alternative approach
                         pass
             
@@ -247,10 +286,12 @@ class SECDownloader:
 
         doc_response = None
         for attempt in range(8):
-            time.sleep(max(1.0, REQUEST_DELAY * (attempt + 1) * 3))
+            if attempt:
+                # Back off before retries; pacing itself is the limiter's job.
+                time.sleep(max(1.0, REQUEST_DELAY * (attempt + 1) * 3))
             try:
-                doc_response = self.session.get(doc_index_url, timeout=REQUEST_TIMEOUT)
-            except Exception:
+                doc_response = self._get(doc_index_url)
+            except requests.RequestException:
                 continue
             if doc_response.status_code in {429, 403, 500, 502, 503, 504}:
                 continue
@@ -350,8 +391,7 @@ class SECDownloader:
             raise Exception(f"No {filing_type} filing found for {original_identifier} in {year}")
         
         # Download the filing
-        time.sleep(REQUEST_DELAY)
-        response = self.session.get(filing_url, timeout=REQUEST_TIMEOUT)
+        response = self._get(filing_url)
         response.raise_for_status()
         
         # Determine file extension from URL
@@ -388,10 +428,11 @@ class SECDownloader:
 
         response = None
         for attempt in range(8):
-            time.sleep(max(REQUEST_DELAY, 0.5) * (attempt + 1))
+            if attempt:
+                time.sleep(max(REQUEST_DELAY, 0.5) * (attempt + 1))
             try:
-                response = self.session.get(filing_url, timeout=REQUEST_TIMEOUT)
-            except Exception:
+                response = self._get(filing_url)
+            except requests.RequestException:
                 continue
             if response.status_code in {429, 403, 500, 502, 503, 504}:
                 continue
@@ -410,6 +451,50 @@ class SECDownloader:
             extension = 'txt'
         return response.text, extension, cik
 
+    def _cached_submission_path(self, accession_formatted: str) -> Optional[Path]:
+        if self.cache_dir is None or not accession_formatted:
+            return None
+        return self.cache_dir / f"{accession_formatted}.txt"
+
+    def _read_cached_submission(self, accession_formatted: str) -> Optional[str]:
+        """Return a cached submission text for the accession, if present."""
+        path = self._cached_submission_path(accession_formatted)
+        if path is None:
+            return None
+        try:
+            body = read_submission_text(path, errors="strict")
+        except FileNotFoundError:
+            return None
+        except (OSError, UnicodeDecodeError):
+            # Corrupt or unreadable entry: treat it as a miss and drop it so
+            # the fresh download can replace it.
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+        return body if body.strip() else None
+
+    def _write_cached_submission(self, accession_formatted: str, body: str) -> None:
+        """Store a downloaded submission text in the accession cache."""
+        path = self._cached_submission_path(accession_formatted)
+        if path is None:
+            return
+        # Write then rename so a concurrent/aborted run never leaves a
+        # truncated cache entry behind; download workers share one process.
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(body.encode("utf-8"))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            # The cache is optional; keep the downloaded body regardless.
+            print(f"Warning: Failed to cache submission {accession_formatted}: {str(e)}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
     def download_submission_text(
         self,
         cik_or_ticker: str,
@@ -421,7 +506,8 @@ class SECDownloader:
 
         Prefer the SEC full-index `file_name` path when available, since it
         points directly to the submission text file. Fall back to
-        accession-derived URLs only when needed.
+        accession-derived URLs only when needed. When a cache_dir is
+        configured, a previously downloaded copy is returned instead.
 
         Args:
             cik_or_ticker: CIK number or ticker symbol
@@ -433,6 +519,9 @@ class SECDownloader:
             Tuple of (submission_text, cik_padded)
         """
         cik, _original_identifier = self._normalize_cik(cik_or_ticker)
+        cached = self._read_cached_submission(accession_formatted)
+        if cached is not None:
+            return cached, cik
         cik_archive = str(int(cik)) if cik.isdigit() else cik.lstrip('0')
         accession_path = accession_formatted.replace('-', '')
         normalized_file_name = (file_name or "").strip().lstrip("/")
@@ -455,11 +544,13 @@ class SECDownloader:
         response = None
         for txt_url in candidate_urls:
             for attempt in range(5):
-                time.sleep(max(1.0, REQUEST_DELAY * (attempt + 1) * 5))
-                response = self.session.get(txt_url, timeout=REQUEST_TIMEOUT)
+                if attempt:
+                    time.sleep(max(1.0, REQUEST_DELAY * (attempt + 1) * 5))
+                response = self._get(txt_url)
                 if response.status_code == 200:
                     body = response.text or ""
                     if body.strip():
+                        self._write_cached_submission(accession_formatted, body)
                         return body, cik
                     # Some SEC endpoints return a 200 with an empty body for the
                     # nested path; treat that as a miss and try the next URL.
@@ -4,7 +4,7 @@ Item Extractor - Extracts individual items from SEC filings
 
 import re
 import unicodedata
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 from bs4 import BeautifulSoup
 from .parser import SECParser
 
@@ -29,6 +29,20 @@ class ItemExtractor:
             "form 10-k summary", "not applicable"
         }
         self._zero_width_chars = ["\u200b", "\u200c", "\u200d", "\ufeff", "\u2060"]
+        self._bullet_pattern = re.compile(r"[\u2022\u25CF\u25A0\u25AA\u25E6\u2043\u2219]")
+        self._page_label_pattern = re.compile(r"page\s+\d{1,4}(?:\s+of\s+\d{1,4})?")
+        self._inline_toc_pattern = re.compile(r"\btable of contents\b", re.IGNORECASE)
+        self._leading_page_number_pattern = re.compile(
+            r'^\s*\d{1,3}\s+(?=ITEM\s+\d+[A-Z]?\b)', re.IGNORECASE
+        )
+        self._terminal_marker_pattern = re.compile(r"\b(?:Not\s+applicable|None)\b\.", re.IGNORECASE)
+        self._sentence_end_pattern = re.compile(r"[.!?;:]")
+        self._trailing_page_number_pattern = re.compile(r'\s+\d{1,3}\s*$')
+        self._page_break_pattern = re.compile(
+            r"<hr[^>]*page-break-after\s*:\s*always[^>]*>", re.IGNORECASE
+        )
+        # Item-specific "ITEM <n>" heading patterns, compiled on first use.
+        self._item_heading_patterns: Dict[str, re.Pattern] = {}
 
     def _normalize_unicode(self, text: str) -> str:
         """
@@ -40,7 +54,7 @@ class ItemExtractor:
         # Remove any remaining unicode formatting/control artifacts.
         text = "".join(ch for ch in text if unicodedata.category(ch) != "Cf")
         # Remove common bullet/ornament symbols that pollute extracted prose.
-        text = re.sub(r"[\u2022\u25CF\u25A0\u25AA\u25E6\u2043\u2219]", " ", text)
+        text = self._bullet_pattern.sub(" ", text)
         return (
             text.replace("\u2018", "'")
             .replace("\u2019", "'")
@@ -79,14 +93,21 @@ class ItemExtractor:
             low = line.lower()
             if low == "table of contents":
                 continue
-            if re.fullmatch(r"page\s+\d{1,4}(?:\s+of\s+\d{1,4})?", low):
+            if self._page_label_pattern.fullmatch(low):
                 continue
             lines.append(line)
         cleaned = "\n".join(lines)
         # Remove inline TOC headers if they survived line filtering.
-        cleaned = re.sub(r"\btable of contents\b", " ", cleaned, flags=re.IGNORECASE)
+        cleaned = self._inline_toc_pattern.sub(" ", cleaned)
         return cleaned
 
+    def _item_heading_pattern(self, item_token: str) -> re.Pattern:
+        pattern = self._item_heading_patterns.get(item_token)
+        if pattern is None:
+            pattern = re.compile(rf'ITEM\s+{re.escape(item_token)}\s*[.:]?\s*', re.IGNORECASE)
+            self._item_heading_patterns[item_token] = pattern
+        return pattern
+
     def _postprocess_item_text(self, text: str, item_number: str) -> str:
         """
         Final text cleanup with item-aware rules:
@@ -97,10 +118,11 @@ class ItemExtractor:
         item_token = self.parser._bare_item_key(item_number)
 
         # Remove leading page number immediately before item heading
-        out = re.sub(r'^\s*\d{1,3}\s+(?=ITEM\s+\d+[A-Z]?\b)', '', out, flags=re.IGNORECASE)
+        out = self._leading_page_number_pattern.sub('', out)
 
         # Trim any preamble before first explicit item heading for this item
-        item_head = re.search(rf'ITEM\s+{re.escape(item_token)}\s*[.:]?\s*', out, flags=re.IGNORECASE)
+        heading_pattern = self._item_heading_pattern(item_token)
+        item_head = heading_pattern.search(out)
         if item_head:
             out = out[item_head.start():]
 
@@ -110,23 +132,19 @@ class ItemExtractor:
         # "appears first" is implemented as:
         # - marker found in early window right after "ITEM X"
         # - no sentence-ending punctuation before marker in that early window
-        heading = re.search(
-            rf"ITEM\s+{re.escape(item_token)}\s*[.:]?\s*",
-            out,
-            flags=re.IGNORECASE,
-        )
+        heading = heading_pattern.search(out)
         if heading:
             after = out[heading.end() : heading.end() + 420]
-            marker = re.search(r"\b(?:Not\s+applicable|None)\b\.", after, flags=re.IGNORECASE)
+            marker = self._terminal_marker_pattern.search(after)
             if marker:
                 prefix = after[: marker.start()]
                 # If there is no earlier sentence-ending punctuation,
                 # treat marker as first terminal sentence and cut there.
-                if not re.search(r"[.!?;:]", prefix):
+                if not self._sentence_end_pattern.search(prefix):
                     out = out[: heading.end() + marker.end()].strip()
 
         # Drop trailing standalone page number tokens.
-        out = re.sub(r'\s+\d{1,3}\s*$', '', out)
+        out = self._trailing_page_number_pattern.sub('', out)
         return out.strip()
 
     def _strip_headers_footers(self, text: str) -> str:
@@ -195,11 +213,9 @@ class ItemExtractor:
         Returns:
             Plain text
         """
-        html_with_breaks = re.sub(
-            r"<hr[^>]*page-break-after\s*:\s*always[^>]*>",
+        html_with_breaks = self._page_break_pattern.sub(
             f"\n{self._page_break_marker}\n",
             html_content,
-            flags=re.IGNORECASE,
         )
 
         soup = BeautifulSoup(html_with_breaks, 'lxml')
@@ -234,7 +250,8 @@ class ItemExtractor:
         return str(soup)
     
     def extract_item(self, html_content: str, item_number: str, 
-                    toc_items: Dict[str, Dict[str, str]]) -> Dict[str, Any]:
+                    toc_items: Dict[str, Dict[str, str]],
+                    positions: Optional[Dict[str, Tuple[int, int]]] = None) -> Dict[str, Any]:
         """
         Extract a specific item from the filing
         OPTIMIZED: Parse once, extract both HTML and text from same parse.
@@ -243,6 +260,8 @@ class ItemExtractor:
             html_content: HTML content of the filing
             item_number: Item number to extract (e.g., "1", "1A", "7")
             toc_items: TOC items dictionary from parser
+            positions: Optional precomputed get_item_positions() result for
+                       html_content; reused across items of the same filing
             
         Returns:
             Dictionary containing:
@@ -255,7 +274,8 @@ class ItemExtractor:
             raise ValueError(f"Item {item_number} not found in TOC")
         
         # Get positions of all items
-        positions = self.parser.get_item_positions(html_content, toc_items)
+        if positions is None:
+            positions = self.parser.get_item_positions(html_content, toc_items)
         
         if item_number not in positions:
             raise ValueError(f"Could not locate Item {item_number} in the document")
@@ -266,11 +286,9 @@ class ItemExtractor:
         item_html = html_content[start_pos:end_pos]
         
         # OPTIMIZED: Parse once, extract both HTML and text
-        html_with_breaks = re.sub(
-            r"<hr[^>]*page-break-after\s*:\s*always[^>]*>",
+        html_with_breaks = self._page_break_pattern.sub(
             f"\n{self._page_break_marker}\n",
             item_html,
-            flags=re.IGNORECASE,
         )
         
         soup = BeautifulSoup(html_with_breaks, 'lxml')
@@ -312,9 +330,17 @@ class ItemExtractor:
         """
         extracted_items = {}
         
-        for item_number in item_numbers:
+        # Item boundaries depend only on the filing, so locate them once
+        # instead of once per item. On failure, let each item report it.
+        try:
+            positions = self.parser.get_item_positions(html_content, toc_items)
+        except Exception:
+            positions = None
+        
+        # dict.fromkeys drops repeated item numbers but keeps request order
+        for item_number in dict.fromkeys(item_numbers):
             try:
-                item_data = self.extract_item(html_content, item_number, toc_items)
+                item_data = self.extract_item(html_content, item_number, toc_items, positions)
                 extracted_items[item_number] = item_data
             except Exception as e:
                 # Log the error but continue with other items
@@ -336,6 +362,6 @@ class ItemExtractor:
         Returns:
             Dictionary mapping item numbers to extracted item data
         """
-        item_numbers = list(toc_items.keys())
+        item_numbers = list(toc_items)
         return self.extract_items(html_content, item_numbers, toc_items)
 
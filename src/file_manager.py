@@ -2,9 +2,11 @@
 File Manager for handling file operations and directory structure
 """
 
-import json
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
+
+from .json_utils import read_json, write_json
+from .submission_parser import read_submission_text
 
 
 class FileManager:
@@ -18,6 +20,16 @@ class FileManager:
             base_dir: Base directory for storing SEC filings
         """
         self.base_dir = base_dir
+        # (cik_ticker, year, filing_type) -> filing directory
+        self._filing_dirs: Dict[Tuple[str, str, str], str] = {}
+
+    def _filing_dir(self, cik_ticker: str, year: str, filing_type: str) -> str:
+        key = (cik_ticker, year, filing_type)
+        path = self._filing_dirs.get(key)
+        if path is None:
+            path = os.path.join(self.base_dir, cik_ticker, year, filing_type)
+            self._filing_dirs[key] = path
+        return path
 
     def get_filing_path(self, cik_ticker: str, year: str, filing_type: str, extension: str = "html") -> str:
         """
@@ -32,9 +44,8 @@ class FileManager:
         Returns:
             Full path to the filing file
         """
-        filename = f"{cik_ticker}_{year}_{filing_type}.{extension}"
-        path = os.path.join(self.base_dir, cik_ticker, year, filing_type, filename)
-        return path
+        filing_dir = self._filing_dir(cik_ticker, year, filing_type)
+        return f"{filing_dir}{os.sep}{cik_ticker}_{year}_{filing_type}.{extension}"
 
     def get_item_path(self, cik_ticker: str, year: str, filing_type: str, item_number: str) -> str:
         """
@@ -49,9 +60,8 @@ class FileManager:
         Returns:
             Full path to the item JSON file
         """
-        filename = f"{cik_ticker}_{year}_{filing_type}_item{item_number}.json"
-        path = os.path.join(self.base_dir, cik_ticker, year, filing_type, "items", filename)
-        return path
+        filing_dir = self._filing_dir(cik_ticker, year, filing_type)
+        return f"{filing_dir}{os.sep}items{os.sep}{cik_ticker}_{year}_{filing_type}_item{item_number}.json"
 
     def create_directory_structure(self, cik_ticker: str, year: str, filing_type: str) -> None:
         """
@@ -62,8 +72,8 @@ class FileManager:
             year: Filing year
             filing_type: Type of filing (10-K or 10-Q)
         """
-        filing_dir = os.path.join(self.base_dir, cik_ticker, year, filing_type)
-        items_dir = os.path.join(filing_dir, "items")
+        filing_dir = self._filing_dir(cik_ticker, year, filing_type)
+        items_dir = f"{filing_dir}{os.sep}items"
 
         os.makedirs(filing_dir, exist_ok=True)
         os.makedirs(items_dir, exist_ok=True)
@@ -102,8 +112,7 @@ class FileManager:
         Returns:
             HTML content
         """
-        with open(file_path, "r", encoding="utf-8") as f:
-            return f.read()
+        return read_submission_text(file_path, errors="strict")
 
     def save_item_json(self, file_path: str, item_data: Dict[str, Any]) -> None:
         """
@@ -114,8 +123,7 @@ class FileManager:
             item_data: Dictionary containing item data
         """
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(item_data, f, indent=2, ensure_ascii=False)
+        write_json(file_path, item_data)
 
     def load_item_json(self, file_path: str) -> Dict[str, Any]:
         """
@@ -127,8 +135,7 @@ class FileManager:
         Returns:
             Dictionary containing item data
         """
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return read_json(file_path)
 
     def load_json(self, file_path: str) -> Dict[str, Any]:
         """
@@ -140,8 +147,7 @@ class FileManager:
         Returns:
             Dictionary containing JSON data
         """
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return read_json(file_path)
 
     def save_json(self, file_path: str, data: Dict[str, Any]) -> None:
         """
@@ -152,5 +158,4 @@ class FileManager:
             data: Dictionary containing data to save
         """
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        write_json(file_path, data)
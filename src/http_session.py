@@ -0,0 +1,36 @@
+"""
+Pooled HTTP session factory for SEC EDGAR requests
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from script.config import HTTP_POOL_MAXSIZE
+
+
+def create_sec_session(user_agent: str) -> requests.Session:
+    """
+    Create a keep-alive session for SEC requests.
+
+    One adapter is mounted per scheme with a pool large enough for parallel
+    download workers, so every request reuses an open connection. urllib3
+    only retries failed connects here; HTTP status retries (429/5xx) stay
+    with the callers' rate-limited backoff loops.
+
+    Args:
+        user_agent: User agent string for SEC requests
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    session.headers.update({'User-Agent': user_agent})
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_MAXSIZE,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=Retry(total=3, connect=3, read=0, status=0, other=0, backoff_factor=0.5),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
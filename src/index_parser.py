@@ -4,24 +4,47 @@ SEC EDGAR Full-Index Parser - Retrieves all companies from quarterly index files
 
 import requests
 import re
-from typing import List, Set, Dict, Tuple
+from typing import List, Set, Dict, Optional, Tuple
 from script.config import SEC_BASE_URL, SEC_USER_AGENT, REQUEST_TIMEOUT, REQUEST_DELAY
 import time
+from .http_session import create_sec_session
+from .rate_limiter import SEC_RATE_LIMITER, TokenBucket
 
 
 class SECIndexParser:
     """Parses SEC EDGAR full-index files to get all companies for a filing type"""
     
-    def __init__(self, user_agent: str = SEC_USER_AGENT):
+    def __init__(
+        self,
+        user_agent: str = SEC_USER_AGENT,
+        session: Optional[requests.Session] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+    ):
         """
         Initialize SECIndexParser
         
         Args:
             user_agent: User agent string for SEC requests
+            session: Optional shared session (e.g. SECDownloader.session)
+            rate_limiter: Request limiter; defaults to the process-wide
+                SEC limiter shared with SECDownloader
         """
         self.user_agent = user_agent
-        self.session = requests.Session()
+        self._owns_session = session is None
+        self.session = session if session is not None else create_sec_session(user_agent)
         self.session.headers.update({'User-Agent': user_agent})
+        self.rate_limiter = rate_limiter if rate_limiter is not None else SEC_RATE_LIMITER
+    
+    def close(self) -> None:
+        """Close the HTTP session if this parser created it"""
+        if self._owns_session:
+            self.session.close()
+    
+    def __enter__(self) -> "SECIndexParser":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
     
     def _download_index_file(self, year: int, quarter: int) -> str:
         """
@@ -42,7 +65,9 @@ class SECIndexParser:
         last_err = None
         for attempt in range(6):
             try:
-                time.sleep(max(REQUEST_DELAY, 0.5) * (attempt + 1))
+                if attempt:
+                    time.sleep(max(REQUEST_DELAY, 0.5) * (attempt + 1))
+                self.rate_limiter.acquire()
                 response = self.session.get(url, timeout=REQUEST_TIMEOUT)
                 # 404 means quarter likely unavailable.
                 if response.status_code == 404:
@@ -53,7 +78,7 @@ class SECIndexParser:
                     continue
                 response.raise_for_status()
                 return response.text
-            except Exception as e:
+            except requests.RequestException as e:
                 last_err = str(e)
                 continue
         raise Exception(f"Failed to download index for {year} Q{quarter}: {last_err}")
@@ -0,0 +1,57 @@
+"""
+JSON read/write helpers with optional orjson acceleration.
+
+orjson is used when installed; otherwise the stdlib json module produces
+the same indented UTF-8 documents.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+PathLike = Union[str, Path]
+
+
+def dumps_json(data: Any, indent: bool = True) -> bytes:
+    """Serialize data to UTF-8 JSON bytes (2-space indent by default)."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            # e.g. integers beyond 64 bits; stdlib handles those.
+            pass
+    if indent:
+        text = json.dumps(data, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    return text.encode("utf-8")
+
+
+def loads_json(raw: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def write_json(path: PathLike, data: Any, indent: bool = True) -> None:
+    """Write data as a JSON document to path."""
+    with open(path, "wb") as f:
+        f.write(dumps_json(data, indent=indent))
+
+
+def read_json(path: PathLike) -> Any:
+    """Read a JSON document from path."""
+    with open(path, "rb") as f:
+        return loads_json(f.read())
@@ -3,9 +3,112 @@ SEC Filing Parser - Detects and parses Table of Contents
 """
 
 import re
+import threading
 import unicodedata
-from typing import Dict, Optional, Tuple
-from bs4 import BeautifulSoup, Tag
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from lxml import etree
+
+from .text_utils import format_char_translation
+
+
+# Only TOC-relevant containers are materialized for TOC detection; once a
+# top-level tag matches, its whole subtree is kept, so link rows keep the
+# tr/td/li/p/div ancestors that _parse_toc_from_links reads for context.
+_TOC_STRAINER = SoupStrainer(
+    ['table', 'tr', 'td', 'th', 'a', 'li', 'h1', 'h2', 'h3', 'h4', 'p', 'div']
+)
+
+# One str.translate pass for _clean_text: drop Cf characters and fold
+# typographic quotes to ASCII.
+_CLEAN_TEXT_TRANSLATION = format_char_translation(
+    {
+        **dict.fromkeys("\u2018\u2019\u201A\u201B\u2032\u02BC\u00B4", "'"),
+        **dict.fromkeys("\u201C\u201D\u201E\u2033", '"'),
+    }
+)
+
+# Containers whose text gives a TOC link its item/part context, nearest first.
+_LINK_CONTEXT_TAGS = ["tr", "td", "li", "p", "div"]
+
+# Block tags Tag.find_previous looks for in _part_from_tag_context.
+_PREVIOUS_BLOCK_TAGS = frozenset({"tr", "p", "div", "td", "li", "h1", "h2", "h3", "h4"})
+
+# Elements whose strings Tag.get_text leaves out.
+_NON_TEXT_TAGS = ("script", "style", "template")
+
+
+# One lxml HTMLParser per thread, reused across calls: a feed parser is
+# ready for the next document after close(), but it is not thread-safe and
+# script/extractor.py shares one SECParser between worker threads.
+_LXML_PARSERS = threading.local()
+
+
+def _lxml_root(html_content: str):
+    """Parse HTML into an lxml tree; None when there is nothing to parse."""
+    parser = getattr(_LXML_PARSERS, "html", None)
+    if parser is None:
+        parser = _LXML_PARSERS.html = etree.HTMLParser()
+    # feed() accepts str with an XML encoding declaration (inline XBRL),
+    # which lxml.html.fromstring() rejects.
+    try:
+        parser.feed(html_content)
+        return parser.close()
+    except etree.LxmlError:
+        # Start the next document on a fresh parser.
+        _LXML_PARSERS.html = None
+        return None
+
+
+# id(node) -> (node, cleaned text); see SECParser._cached_clean_text.
+_TextCache = Dict[int, Tuple[Any, str]]
+
+
+def _soup_text(tag: Tag) -> str:
+    return tag.get_text(" ", strip=True)
+
+
+def _lxml_strings(element) -> Iterator[str]:
+    if element.text:
+        yield element.text
+    for child in element:
+        if isinstance(child.tag, str) and child.tag not in _NON_TEXT_TAGS:
+            yield from _lxml_strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def _lxml_text(element) -> str:
+    """lxml counterpart of Tag.get_text(" ", strip=True)."""
+    if next(element.iterdescendants(*_NON_TEXT_TAGS), None) is None:
+        strings = element.itertext()
+    else:
+        strings = _lxml_strings(element)
+    return " ".join(s for s in (t.strip() for t in strings) if s)
+
+
+def _previous_block(element):
+    """
+    lxml counterpart of Tag.find_previous(_PREVIOUS_BLOCK_TAGS): the nearest
+    block before element in document order, ancestors included.
+
+    Walks backwards one node at a time (a previous sibling's deepest last
+    descendant, otherwise the parent), so the cost is the distance to the
+    block rather than the element's position in the filing.
+    """
+    node = element
+    while True:
+        prev = node.getprevious()
+        if prev is None:
+            node = node.getparent()
+            if node is None:
+                return None
+        else:
+            while len(prev):
+                prev = prev[-1]
+            node = prev
+        if node.tag in _PREVIOUS_BLOCK_TAGS:
+            return node
 
 
 class SECParser:
@@ -23,21 +126,84 @@ class SECParser:
         ]
         self.item_pattern = re.compile(r'item\s+(\d+[A-Za-z]?)\b', re.IGNORECASE)
         self.part_item_pattern = re.compile(r'part\s+[IV]+\s*[–-]\s*item\s+(\d+[A-Za-z]?)\b', re.IGNORECASE)
+        # _extract_item_number patterns. "Part II - Item 1A" needs no pattern
+        # of its own: any text it matches also contains "Item 1A", which
+        # item_ref_pattern finds first. The leading-number variants are tried
+        # in order as one alternation anchored at the start of the text.
+        self.item_ref_pattern = re.compile(r'item\s+(\d{1,2}[A-Za-z]?)\b', re.IGNORECASE)  # "Item 1A", "Item 7"
+        self.leading_item_number_pattern = re.compile(
+            r'\s*(\d{1,2}[A-Za-z]?)(?=[A-Za-z])'  # "1Business", "1ARisk Factors"
+            r'|\s*(\d{1,2}[A-Za-z]?)\s*[.:-]\s*[A-Za-z]'  # "1A. Risk Factors", "1: Business"
+            r'|\s*(\d{1,2}[A-Za-z]?)\s+[A-Za-z]',  # "1A Risk Factors" (TOC row variant)
+            re.IGNORECASE,
+        )
+        # _extract_item_numbers patterns
+        self.items_combo_pattern = re.compile(
+            r'\bitems?\s+(\d{1,2}[a-z]?)\s*(?:[.:])?\s+and\s+(\d{1,2}[a-z]?)\b',
+            re.IGNORECASE,
+        )
+        self.item_numbers_patterns = tuple(
+            re.compile(p, re.IGNORECASE)
+            for p in (
+                r'item\s+(\d{1,2}[a-z]?)\b',
+                r'part\s+[ivx]+\s*[.:-]?\s*(\d{1,2}[a-z]?)\s*[.:]',
+                r'(?<!\d)(\d{1,2}[a-z]?)\s*[.:]\s*[a-z]',
+            )
+        )
         self.part_heading_html_pattern = re.compile(
             r'>\s*PART(?:\s|&nbsp;)+[IVXLC]+\b',
             re.IGNORECASE,
         )
     
+        self.part_item_key_pattern = re.compile(r"^[IVX]+_[0-9]")
+        self.part_label_pattern = re.compile(r"\bPART\s+([IVXLC]+)\b", re.IGNORECASE)
+        # _clean_item_title: "Item 1. Business 1" -> "Item 1. Business",
+        # "Business.1" -> "Business.", "Business 12 3" -> "Business".
+        self.trailing_page_number_pattern = re.compile(r'(?:(\.)\s*\d+|\d+)?(?:\s+\d+)?\s*$')
+    
         self.toc_marker_pattern = re.compile(
             r'table\s+of\s+contents|index\s+to\s+financial\s+statements',
             re.IGNORECASE,
         )
+        # TOC table indicators, matched in one scan of the lowercased table
+        # text instead of one substring test per indicator.
+        self.toc_indicator_pattern = re.compile(
+            '|'.join(
+                re.escape(indicator)
+                for indicator in (
+                    'table of contents',
+                    'index to financial statements',
+                    'item 1.',
+                    'item 1a',
+                    'part i',
+                    'part ii',
+                    'item 1 ',  # Match "Item 1 " pattern
+                )
+            )
+        )
+        self.toc_item_ref_pattern = re.compile(r'item\s+\d+[a-z]?')
+        self.toc_table_hint_pattern = re.compile(r'item|part|contents|index', re.IGNORECASE)
+        # _find_toc_table stops at the first linked, indicated table with at
+        # least this many item references.
+        self.toc_table_confident_items = 10
+        # Cheap raw-HTML probe for any href carrying a fragment ("#..."),
+        # including entity-encoded "#". Link-based TOC parsing can only
+        # yield anchored items from such hrefs.
+        self.fragment_href_pattern = re.compile(
+            r'href\s*=\s*(?:"[^"]*|\'[^\']*|[^\s"\'>]*)(?:#|&#0*35;?|&#x0*23;?|&num;?)',
+            re.IGNORECASE,
+        )
         # TOC should appear near the beginning of the filing.
         # Inline XBRL filings can prepend very large hidden headers, so we
         # allow a larger offset while still requiring explicit TOC markers.
         self.max_toc_marker_offset = 4000000
         self.toc_region_padding_before = 3000
         self.toc_region_length = 260000
+        # The TOC closes with its "Signatures" row: the strained region soup
+        # stops at the first table end after it, but never shorter than
+        # toc_region_min_length past the marker.
+        self.toc_region_end_pattern = re.compile(r'signatures(?s:.*?)</table\s*>', re.IGNORECASE)
+        self.toc_region_min_length = 20000
         # Fallback window when no explicit TOC marker exists.
         self.toc_fallback_prefix_length = 800000
 
@@ -51,28 +217,42 @@ class SECParser:
 
     def _bare_item_key(self, item_key: str) -> str:
         token = (item_key or "").strip().upper()
-        if re.match(r"^[IVX]+_[0-9]", token):
+        if self.part_item_key_pattern.match(token):
             return token.split("_", 1)[1]
         return token
 
     def _normalize_part(self, text: Optional[str]) -> Optional[str]:
         if not text:
             return None
-        match = re.search(r"\bPART\s+([IVXLC]+)\b", text, flags=re.IGNORECASE)
+        match = self.part_label_pattern.search(text)
         return match.group(1).upper() if match else None
 
-    def _part_from_tag_context(self, tag: Optional[Tag]) -> Optional[str]:
+    def _cached_clean_text(self, node: Any, get_text: Callable[[Any], str], cache: _TextCache) -> str:
+        """
+        _clean_text(get_text(node)), memoized by id(node) for one parse_toc
+        call. The node is stored with its text so its id cannot be reused
+        while the cache is alive.
+        """
+        hit = cache.get(id(node))
+        if hit is not None:
+            return hit[1]
+        text = self._clean_text(get_text(node))
+        cache[id(node)] = (node, text)
+        return text
+
+    def _part_from_tag_context(self, tag: Optional[Tag], text_cache: Optional[_TextCache] = None) -> Optional[str]:
+        cache: _TextCache = {} if text_cache is None else text_cache
         node = tag
         steps = 0
         while node is not None and steps < 30:
-            text = self._clean_text(node.get_text(" ", strip=True))
+            text = self._cached_clean_text(node, _soup_text, cache)
             part = self._normalize_part(text)
             if part:
                 return part
             prev = node.find_previous(["tr", "p", "div", "td", "li", "h1", "h2", "h3", "h4"])
             if prev is None or prev == node:
                 break
-            prev_text = self._clean_text(prev.get_text(" ", strip=True))
+            prev_text = self._cached_clean_text(prev, _soup_text, cache)
             part = self._normalize_part(prev_text)
             if part:
                 return part
@@ -122,13 +302,9 @@ class SECParser:
             Cleaned text
         """
         # Normalize and remove invisible formatting chars (generic cleanup)
-        text = unicodedata.normalize("NFKC", text)
-        text = "".join(ch for ch in text if unicodedata.category(ch) != "Cf")
-        text = re.sub(r"[\u2018\u2019\u201A\u201B\u2032\u02BC\u00B4]", "'", text)
-        text = re.sub(r"[\u201C\u201D\u201E\u2033]", '"', text)
-        # Replace multiple whitespaces with single space
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        text = unicodedata.normalize("NFKC", text).translate(_CLEAN_TEXT_TRANSLATION)
+        # Collapse whitespace runs to single spaces and trim the ends
+        return ' '.join(text.split())
     
     def _clean_item_title(self, text: str) -> str:
         """
@@ -140,11 +316,11 @@ class SECParser:
         Returns:
             Cleaned title without page numbers
         """
-        # Remove trailing page numbers (common patterns)
-        # Pattern: digit(s) at the end, possibly after dots or spaces
-        text = re.sub(r'\s+\d+\s*$', '', text)  # "Item 1. Business 1" -> "Item 1. Business"
-        text = re.sub(r'\.\s*\d+\s*$', '.', text)  # "Business.1" -> "Business."
-        text = re.sub(r'\d+\s*$', '', text)  # Remove trailing digits
+        # Remove trailing page numbers (common patterns) in one pass; a page
+        # number glued to a period keeps the period ("Business.1" -> "Business.")
+        text = self.trailing_page_number_pattern.sub(
+            lambda m: '.' if m.group(1) else '', text, count=1
+        )
         return text.strip()
     
     def _extract_item_number(self, text: str) -> Optional[str]:
@@ -156,20 +332,14 @@ class SECParser:
             
         Returns:
             Item number (e.g., "1", "1A", "7") or None
-        """        # Common patterns for items
-        patterns = [
-            r'item\s+(\d{1,2}[A-Za-z]?)\b',  # "Item 1A", "Item 7"
-            r'part\s+[IV]+\s*[–-]\s*item\s+(\d{1,2}[A-Za-z]?)\b',  # "Part II - Item 1A"
-            r'^\s*(\d{1,2}[A-Za-z]?)(?=[A-Za-z])',  # "1Business", "1ARisk Factors"
-            r'^\s*(\d{1,2}[A-Za-z]?)\s*[.:-]\s*[A-Za-z]',  # "1A. Risk Factors", "1: Business"
-            r'^\s*(\d{1,2}[A-Za-z]?)\s+[A-Za-z]',  # "1A Risk Factors" (TOC row variant)
-        ]
+        """
         text_lower = text.lower()
-        for pattern in patterns:
-            match = re.search(pattern, text_lower, re.IGNORECASE)
-            if match:
-                return match.group(1).upper()
-        
+        match = self.item_ref_pattern.search(text_lower)
+        if match:
+            return match.group(1).upper()
+        match = self.leading_item_number_pattern.match(text_lower)
+        if match:
+            return match.group(match.lastindex).upper()
         return None
 
     def _extract_item_numbers(self, text: str) -> list[str]:
@@ -187,11 +357,7 @@ class SECParser:
 
         # Handle explicit combined plural rows first (non-standard but seen in filings),
         # e.g. "Items 1 and 2. Business and Properties".
-        combo = re.search(
-            r'\bitems?\s+(\d{1,2}[a-z]?)\s*(?:[.:])?\s+and\s+(\d{1,2}[a-z]?)\b',
-            text_lower,
-            re.IGNORECASE,
-        )
+        combo = self.items_combo_pattern.search(text_lower)
         if combo:
             for g in (combo.group(1), combo.group(2)):
                 token = g.upper()
@@ -199,13 +365,8 @@ class SECParser:
                     seen.add(token)
                     found.append(token)
 
-        patterns = [
-            r'item\s+(\d{1,2}[a-z]?)\b',
-            r'part\s+[ivx]+\s*[.:-]?\s*(\d{1,2}[a-z]?)\s*[.:]',
-            r'(?<!\d)(\d{1,2}[a-z]?)\s*[.:]\s*[a-z]',
-        ]
-        for pat in patterns:
-            for m in re.finditer(pat, text_lower, re.IGNORECASE):
+        for pat in self.item_numbers_patterns:
+            for m in pat.finditer(text_lower):
                 token = m.group(1).upper()
                 if token not in seen:
                     seen.add(token)
@@ -229,30 +390,29 @@ class SECParser:
         potential_toc_tables = []
         
         for table in tables:
-            table_text = self._clean_text(table.get_text())
+            raw_text = table.get_text()
+            # Every indicator and item reference contains one of these words.
+            # For ASCII text _clean_text changes only whitespace, so a table
+            # without them cannot qualify and its cleaning can be skipped.
+            if raw_text.isascii() and not self.toc_table_hint_pattern.search(raw_text):
+                continue
+            table_text = self._clean_text(raw_text)
             table_text_lower = table_text.lower()
             
-            # Check if table contains TOC indicators
-            toc_indicators = [
-                'table of contents',
-                'index to financial statements',
-                'item 1.',
-                'item 1a',
-                'part i',
-                'part ii',
-                'item 1 ',  # Match "Item 1 " pattern
-            ]
-            
             # Count how many item references are in the table
-            item_count = len(re.findall(r'item\s+\d+[a-z]?', table_text_lower))
+            item_count = sum(1 for _ in self.toc_item_ref_pattern.finditer(table_text_lower))
             
             # If table has TOC indicators or many items, it's likely the TOC
-            has_toc_indicator = any(indicator in table_text_lower for indicator in toc_indicators)
+            has_toc_indicator = self.toc_indicator_pattern.search(table_text_lower) is not None
             
             if (has_toc_indicator or item_count >= 2):
                 # Additional validation - check if it has links/anchors
-                links = table.find_all('a')
-                if links or item_count >= 3:  # Must have links OR at least 3 items
+                has_links = table.find('a') is not None
+                # A linked table with an indicator and a full item list is the
+                # TOC; the formatting tables after it need not be cleaned.
+                if has_links and has_toc_indicator and item_count >= self.toc_table_confident_items:
+                    return table
+                if has_links or item_count >= 3:  # Must have links OR at least 3 items
                     potential_toc_tables.append((item_count, table))
         
         # Return the table with the most items (most likely to be the real TOC)
@@ -279,6 +439,22 @@ class SECParser:
         start = max(0, marker_match.start() - self.toc_region_padding_before)
         end = min(len(html_content), marker_match.start() + self.toc_region_length)
         return html_content[start:end]
+
+    def _trim_toc_region(self, toc_region_html: str) -> str:
+        """
+        Cut a TOC region after the table that closes the TOC.
+
+        Inline XBRL bodies wrap nearly every fact in ix:* tags, and the region
+        window usually runs deep into them; the tail past the TOC's
+        "Signatures" row holds no TOC rows but still has to be tokenized.
+        """
+        marker_match = self.toc_marker_pattern.search(toc_region_html)
+        marker_pos = marker_match.start() if marker_match else 0
+        end_match = self.toc_region_end_pattern.search(toc_region_html, marker_pos)
+        if not end_match:
+            return toc_region_html
+        end = max(end_match.end(), marker_pos + self.toc_region_min_length)
+        return toc_region_html[:end]
     
     def _parse_toc_from_table(self, table: Tag, filing_type: str) -> Dict[str, Dict[str, str]]:
         """
@@ -406,15 +582,92 @@ class SECParser:
         
         return toc_items
 
-    def _parse_toc_from_links(self, soup: BeautifulSoup, filing_type: str) -> Dict[str, Dict[str, str]]:
+    def _has_fragment_links(self, html_content: str, endpos: Optional[int] = None) -> bool:
+        """
+        Return True if html_content[:endpos] may contain an href with a
+        fragment. False means _parse_toc_from_links cannot find anchored items
+        there, so the (expensive) soup build for that text can be skipped.
+        """
+        if endpos is None:
+            endpos = len(html_content)
+        return self.fragment_href_pattern.search(html_content, 0, endpos) is not None
+
+    def _parse_toc_from_links(
+        self,
+        soup: BeautifulSoup,
+        filing_type: str,
+        text_cache: Optional[_TextCache] = None,
+    ) -> Dict[str, Dict[str, str]]:
         """
         Parse TOC from anchor links (common in inline-XBRL filings where TOC is
         represented as linked item labels instead of a clean table).
+
+        text_cache memoizes cleaned tag text; links in one row share their
+        tr/td context, and part lookups revisit the same preceding blocks.
+        """
+        cache: _TextCache = {} if text_cache is None else text_cache
+        return self._toc_items_from_links(
+            soup.find_all("a", href=True),
+            filing_type,
+            text_of=lambda tag: self._cached_clean_text(tag, _soup_text, cache),
+            parent_of=lambda tag, names: tag.find_parent(names),
+            part_of=lambda tag: self._part_from_tag_context(tag, cache),
+        )
+
+    def _parse_toc_from_links_html(self, html_content: str, filing_type: str) -> Dict[str, Dict[str, str]]:
+        """
+        _parse_toc_from_links over an lxml tree built straight from HTML.
+
+        Used for the prefix and full-document rescans, which only need links
+        and their ancestors: lxml's C-level ancestor/preceding walks replace
+        BeautifulSoup tree construction plus find_parent/find_previous.
+        """
+        root = _lxml_root(html_content)
+        if root is None:
+            return {}
+        cache: _TextCache = {}
+        return self._toc_items_from_links(
+            (a for a in root.iter("a") if a.get("href") is not None),
+            filing_type,
+            text_of=lambda el: self._cached_clean_text(el, _lxml_text, cache),
+            parent_of=lambda el, names: next(el.iterancestors(*names), None),
+            part_of=lambda el: self._part_from_element_context(el, cache),
+        )
+
+    def _part_from_element_context(self, element, text_cache: _TextCache) -> Optional[str]:
+        """lxml counterpart of _part_from_tag_context."""
+        node = element
+        steps = 0
+        while node is not None and steps < 30:
+            part = self._normalize_part(self._cached_clean_text(node, _lxml_text, text_cache))
+            if part:
+                return part
+            prev = _previous_block(node)
+            if prev is None or prev is node:
+                break
+            part = self._normalize_part(self._cached_clean_text(prev, _lxml_text, text_cache))
+            if part:
+                return part
+            node = prev
+            steps += 1
+        return None
+
+    def _toc_items_from_links(
+        self,
+        links: Iterable[Any],
+        filing_type: str,
+        *,
+        text_of: Callable[[Any], str],
+        parent_of: Callable[[Any, List[str]], Any],
+        part_of: Callable[[Any], Optional[str]],
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Shared link-to-TOC logic; text_of (cleaned node text), parent_of and
+        part_of adapt it to a BeautifulSoup or an lxml tree.
         """
         toc_items: Dict[str, Dict[str, str]] = {}
-        links = soup.find_all("a", href=True)
         for link in links:
-            link_text = self._clean_text(link.get_text(" ", strip=True))
+            link_text = text_of(link)
 
             href = link.get("href", "").strip()
             if not href:
@@ -434,11 +687,11 @@ class SECParser:
             context_text = ""
             item_numbers: list[str] = []
             chosen_context = None
-            for tag_name in ["tr", "td", "li", "p", "div"]:
-                candidate = link.find_parent(tag_name)
-                if not candidate:
+            for tag_name in _LINK_CONTEXT_TAGS:
+                candidate = parent_of(link, [tag_name])
+                if candidate is None:
                     continue
-                candidate_text = self._clean_text(candidate.get_text(" ", strip=True))
+                candidate_text = text_of(candidate)
                 if not candidate_text:
                     continue
                 nums = self._extract_item_numbers(candidate_text)
@@ -453,8 +706,8 @@ class SECParser:
 
             if not context_text:
                 # Fallback to nearest acceptable container text, then link text.
-                container = link.find_parent(["tr", "td", "li", "p", "div"])
-                context_text = self._clean_text(container.get_text(" ", strip=True)) if container else link_text
+                container = parent_of(link, _LINK_CONTEXT_TAGS)
+                context_text = text_of(container) if container is not None else link_text
 
             title_text = context_text if 0 < len(context_text) <= 250 else link_text
             if not item_numbers:
@@ -465,7 +718,9 @@ class SECParser:
             if not item_numbers:
                 continue
 
-            part = self._normalize_part(context_text) or self._part_from_tag_context(chosen_context or link)
+            part = self._normalize_part(context_text) or part_of(
+                chosen_context if chosen_context is not None else link
+            )
             for item_number in item_numbers:
                 item_key = self._item_key(item_number, filing_type, part)
                 existing = toc_items.get(item_key)
@@ -500,7 +755,15 @@ class SECParser:
             # In that case, only attempt table-based detection in the beginning region.
             toc_region_html = html_content[:self.toc_fallback_prefix_length]
 
-        soup = BeautifulSoup(toc_region_html, 'html.parser')
+        # lxml's C builder, strained: scripts, styles and stray inline wrappers
+        # outside the strainer's containers are never built.
+        soup = BeautifulSoup(
+            self._trim_toc_region(toc_region_html) if has_explicit_marker else toc_region_html,
+            'lxml',
+            parse_only=_TOC_STRAINER,
+        )
+        # Cleaned link-context text for this soup, shared by both link passes.
+        text_cache: _TextCache = {}
         
         def _merge_missing(base: Dict[str, Dict[str, str]], extra: Dict[str, Dict[str, str]]) -> Dict[str, Dict[str, str]]:
             for k, v in extra.items():
@@ -519,7 +782,7 @@ class SECParser:
             toc_items = self._parse_toc_from_table(toc_table, filing_type)
             if toc_items and len(toc_items) >= 2:
                 # Enrich table-derived TOC with link-derived anchors/titles.
-                linked_items = self._parse_toc_from_links(soup, filing_type)
+                linked_items = self._parse_toc_from_links(soup, filing_type, text_cache)
                 for k, v in linked_items.items():
                     if k not in toc_items:
                         toc_items[k] = v
@@ -532,41 +795,49 @@ class SECParser:
                 if anchored_count >= 2:
                     # Enrich once with a broader prefix scan to recover edge rows
                     # not present in the immediate TOC marker region.
-                    broad_soup = BeautifulSoup(html_content[: self.toc_fallback_prefix_length], "html.parser")
-                    broad_items = self._parse_toc_from_links(broad_soup, filing_type)
+                    broad_items = self._parse_toc_from_links_html(
+                        html_content[: self.toc_fallback_prefix_length], filing_type
+                    )
                     toc_items = _merge_missing(toc_items, broad_items)
                     return self._finalize_toc_items(toc_items, filing_type)
 
         # Try parsing linked TOC entries from the TOC region.
-        toc_items = self._parse_toc_from_links(soup, filing_type)
+        toc_items = self._parse_toc_from_links(soup, filing_type, text_cache)
         anchored_count = sum(1 for v in toc_items.values() if v.get("anchor"))
         if toc_items and len(toc_items) >= 5 and anchored_count >= 5:
-            broad_soup = BeautifulSoup(html_content[: self.toc_fallback_prefix_length], "html.parser")
-            broad_items = self._parse_toc_from_links(broad_soup, filing_type)
+            broad_items = self._parse_toc_from_links_html(
+                html_content[: self.toc_fallback_prefix_length], filing_type
+            )
             toc_items = _merge_missing(toc_items, broad_items)
             return self._finalize_toc_items(toc_items, filing_type)
  
         # Some filings place index/TOC links outside the immediate TOC marker
         # region (e.g., repeated page headers with linked ITEM anchors).
         # Fallback to a larger prefix scan, then full-document link scan.
-        broad_soup = BeautifulSoup(html_content[: self.toc_fallback_prefix_length], "html.parser")
-        toc_items = self._parse_toc_from_links(broad_soup, filing_type)
-        anchored_count = sum(1 for v in toc_items.values() if v.get("anchor"))
-        if toc_items and len(toc_items) >= 5 and anchored_count >= 5:
-            return self._finalize_toc_items(toc_items, filing_type)
+        # Both passes only count anchored links, so skip them when the raw
+        # HTML has no fragment hrefs at all.
+        if self._has_fragment_links(html_content, self.toc_fallback_prefix_length):
+            toc_items = self._parse_toc_from_links_html(
+                html_content[: self.toc_fallback_prefix_length], filing_type
+            )
+            anchored_count = sum(1 for v in toc_items.values() if v.get("anchor"))
+            if toc_items and len(toc_items) >= 5 and anchored_count >= 5:
+                return self._finalize_toc_items(toc_items, filing_type)
 
-        full_soup = BeautifulSoup(html_content, "html.parser")
-        toc_items = self._parse_toc_from_links(full_soup, filing_type)
-        anchored_count = sum(1 for v in toc_items.values() if v.get("anchor"))
-        if toc_items and len(toc_items) >= 5 and anchored_count >= 5:
-            return self._finalize_toc_items(toc_items, filing_type)
+        if self._has_fragment_links(html_content):
+            toc_items = self._parse_toc_from_links_html(html_content, filing_type)
+            anchored_count = sum(1 for v in toc_items.values() if v.get("anchor"))
+            if toc_items and len(toc_items) >= 5 and anchored_count >= 5:
+                return self._finalize_toc_items(toc_items, filing_type)
 
         # If no explicit marker exists, do not perform loose structure fallback.
         if not has_explicit_marker:
             return None
 
-        # Fallback: analyze document structure (but limit search)
-        toc_items = self._find_toc_from_structure(soup, filing_type)
+        # Fallback: analyze document structure (but limit search).
+        # The nearby-anchor check relies on Tag.sourceline, which only the
+        # html.parser builder records, so this last resort re-parses with it.
+        toc_items = self._find_toc_from_structure(BeautifulSoup(toc_region_html, 'html.parser'), filing_type)
         
         # Only return if we found at least 2 items
         if len(toc_items) >= 2:
@@ -586,7 +857,6 @@ class SECParser:
         Returns:
             Dictionary mapping item numbers to (start_pos, end_pos) tuples
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
         positions = {}
         
         # Preserve TOC appearance order. This is important for combined rows
@@ -594,17 +864,63 @@ class SECParser:
         # have the same section boundary before the next TOC item (e.g., Item 1A).
         sorted_items = list(toc_items.keys())
 
+        # Lowercased once so the common id="x" / name='x' spellings can be
+        # located case-insensitively with str.find. Skipped if lowercasing
+        # changes the length (rare non-ASCII case mappings), since positions
+        # must line up with html_content.
+        html_lower = html_content.lower()
+        if len(html_lower) != len(html_content):
+            html_lower = None
+
+        # anchor -> compiled id/name attribute pattern, built once per call.
+        anchor_patterns: Dict[str, re.Pattern] = {}
+
+        def _anchor_attr_pos(anchor_val: str, search_from: int) -> int:
+            pattern = anchor_patterns.get(anchor_val)
+            if pattern is None:
+                pattern = anchor_patterns[anchor_val] = re.compile(
+                    rf'(?:id|name)\s*=\s*[\'\"]{re.escape(anchor_val)}[\'\"]', re.IGNORECASE
+                )
+            if html_lower is not None:
+                value = anchor_val.lower()
+                best = -1
+                for needle in (f'id="{value}"', f"id='{value}'", f'name="{value}"', f"name='{value}'"):
+                    pos = html_lower.find(needle, search_from)
+                    if pos != -1 and (best == -1 or pos < best):
+                        best = pos
+                if best != -1:
+                    # Spaces around "=" or mixed quotes can still come before
+                    # the first literal hit, so the regex covers that stretch.
+                    m = pattern.search(html_content, search_from, best)
+                    return m.start() if m else best
+            # No literal hit, or no lowercased copy to search.
+            m = pattern.search(html_content, search_from)
+            return m.start() if m else -1
+
+        # anchor -> first attribute position in the whole filing. The item
+        # loop asks for the same anchors again and again (each unanchored
+        # item scans back and forward through its neighbours), so each anchor
+        # is located once; later lookups reuse it when it lies at or after
+        # search_from, and -1 means it occurs nowhere.
+        first_anchor_pos: Dict[str, int] = {}
+
         def _anchor_start(anchor_val: Optional[str], search_from: int = 0) -> int:
             if not anchor_val:
                 return -1
-            anchor_pattern = rf'(?:id|name)\s*=\s*[\'\"]{re.escape(anchor_val)}[\'\"]'
-            m = re.search(anchor_pattern, html_content[search_from:], re.IGNORECASE)
-            if not m:
+            pos = first_anchor_pos.get(anchor_val)
+            if pos is None:
+                pos = first_anchor_pos[anchor_val] = _anchor_attr_pos(anchor_val, 0)
+            if pos != -1 and pos < search_from:
+                pos = _anchor_attr_pos(anchor_val, search_from)
+            if pos == -1:
                 return -1
-            pos = search_from + m.start()
             tag_open = html_content.rfind('<', 0, pos)
             return tag_open if tag_open != -1 else pos
 
+        # Item heading patterns, compiled once per item number per call; the
+        # heading search runs for every unanchored item and its neighbours.
+        heading_patterns: Dict[str, re.Pattern] = {}
+
         def _find_item_heading_start(item_num: str, lo: int, hi: int) -> int:
             """
             Fallback start finder for items that have no TOC anchor.
@@ -613,32 +929,49 @@ class SECParser:
             """
             if hi <= lo:
                 return -1
-            window = html_content[lo:hi]
-            # Allow tags/non-breaking spaces between ITEM and item number.
-            item_pat = re.compile(
-                rf'ITEM(?:\s|&nbsp;|&#160;|<[^>]+>){{0,20}}{re.escape(item_num)}(?:\b|[.:])',
-                re.IGNORECASE,
-            )
-            matches = list(item_pat.finditer(window))
-            if not matches:
+            item_pat = heading_patterns.get(item_num)
+            if item_pat is None:
+                # Allow tags/non-breaking spaces between ITEM and item number.
+                item_pat = re.compile(
+                    rf'ITEM(?:\s|&nbsp;|&#160;|<[^>]+>){{0,20}}{re.escape(item_num)}(?:\b|[.:])',
+                    re.IGNORECASE,
+                )
+                heading_patterns[item_num] = item_pat
+            # pos/endpos bound the scan without copying html_content[lo:hi].
+            m = None
+            for m in item_pat.finditer(html_content, lo, hi):
+                pass
+            if m is None:
                 return -1
-            m = matches[-1]
-            pos = lo + m.start()
+            pos = m.start()
             tag_open = html_content.rfind('<', lo, pos)
             return tag_open if tag_open != -1 else pos
 
-        def _find_next_heading_among(items: list[str], lo: int, hi: int) -> int:
+        # end-marker pattern index -> (search_from, match start or -1) of its
+        # last scan. Items sharing the final anchor all look for the same
+        # trailing marker; a scan from an earlier offset still answers a later
+        # one when its hit lies at or after the new offset (or it found none).
+        end_marker_hits: Dict[int, Tuple[int, int]] = {}
+
+        def _end_marker_start(search_from: int) -> int:
             """
-            Find earliest heading occurrence among candidate item numbers in [lo, hi).
+            Opening tag of the first end marker (SIGNATURES, EXHIBITS, ...)
+            at or after search_from. Patterns are tried in priority order, so
+            a lower-priority marker only counts when no earlier pattern occurs.
             """
-            best = -1
-            for candidate_item in items:
-                pos = _find_item_heading_start(candidate_item, lo, hi)
-                if pos == -1:
-                    continue
-                if best == -1 or pos < best:
-                    best = pos
-            return best
+            for idx, compiled_pattern in enumerate(self.end_marker_patterns):
+                hit = end_marker_hits.get(idx)
+                if hit is not None and hit[0] <= search_from and (hit[1] == -1 or hit[1] >= search_from):
+                    marker_pos = hit[1]
+                else:
+                    marker_match = compiled_pattern.search(html_content, search_from)
+                    marker_pos = marker_match.start() if marker_match else -1
+                    end_marker_hits[idx] = (search_from, marker_pos)
+                if marker_pos != -1:
+                    # Find the tag opening < before this marker
+                    tag_open = html_content.rfind('<', 0, marker_pos)
+                    return tag_open if tag_open != -1 else marker_pos
+            return -1
 
         def trim_end_at_part_heading(start_pos: int, end_pos: int) -> int:
             """
@@ -647,12 +980,11 @@ class SECParser:
             """
             if end_pos <= start_pos:
                 return end_pos
-            segment = html_content[start_pos:end_pos]
-            match = self.part_heading_html_pattern.search(segment)
+            match = self.part_heading_html_pattern.search(html_content, start_pos, end_pos)
             if not match:
                 return end_pos
 
-            candidate = start_pos + match.start()
+            candidate = match.start()
             # Guardrails to avoid truncating on incidental in-text mentions.
             if (candidate - start_pos) < 200:
                 return end_pos
@@ -666,15 +998,6 @@ class SECParser:
             bare_item_num = self._bare_item_key(item_num)
             anchor = toc_items[item_num].get('anchor')
             
-            # Find the element with this anchor
-            start_element = None
-            
-            if anchor:
-                # Look for anchor by name or id
-                start_element = soup.find(attrs={'name': anchor})
-                if not start_element:
-                    start_element = soup.find(attrs={'id': anchor})
-            
             # Determine start position in raw HTML (avoid BeautifulSoup re-serialization)
             # Find the anchor id/name attribute, then locate the opening tag
             start_pos = -1
@@ -722,16 +1045,10 @@ class SECParser:
                         next_anchor = toc_items[next_item].get('anchor')
 
                     if next_item and next_anchor:
-                        next_anchor_pattern = rf'(?:id|name)\s*=\s*[\'\"]{re.escape(next_anchor)}[\'\"]'
-                        next_anchor_match = re.search(next_anchor_pattern, html_content[start_pos:], re.IGNORECASE)
-                        if next_anchor_match:
-                            # Find the tag opening < before this anchor
-                            anchor_pos_in_full = start_pos + next_anchor_match.start()
-                            tag_open = html_content.rfind('<', 0, anchor_pos_in_full)
-                            if tag_open != -1:
-                                end_pos = tag_open
-                            else:
-                                end_pos = anchor_pos_in_full
+                        # Opening tag of the next anchor at or after this item's start.
+                        next_anchor_pos = _anchor_start(next_anchor, start_pos)
+                        if next_anchor_pos != -1:
+                            end_pos = next_anchor_pos
                     elif next_item:
                         # Next item has no anchor: fallback to next heading search.
                         # Limit search to before the next anchored item after current.
@@ -759,32 +1076,16 @@ class SECParser:
                     else:
                         # No next distinct item found (all remaining share same anchor).
                         # Fall through to end-marker boundary like the last item case.
-                        for compiled_pattern in self.end_marker_patterns:
-                            marker_match = compiled_pattern.search(html_content[start_pos:])
-                            if marker_match:
-                                marker_pos_in_full = start_pos + marker_match.start()
-                                tag_open = html_content.rfind('<', 0, marker_pos_in_full)
-                                if tag_open != -1:
-                                    end_pos = tag_open
-                                else:
-                                    end_pos = marker_pos_in_full
-                                break
+                        marker_pos = _end_marker_start(start_pos)
+                        if marker_pos != -1:
+                            end_pos = marker_pos
                     end_pos = trim_end_at_part_heading(start_pos, end_pos)
 
                 else:
                     # For the last item, search for end-marker IDs as boundary
-                    # OPTIMIZED: Use pre-compiled patterns instead of compiling on each use
-                    for compiled_pattern in self.end_marker_patterns:
-                        marker_match = compiled_pattern.search(html_content[start_pos:])
-                        if marker_match:
-                            # Find the tag opening < before this marker
-                            marker_pos_in_full = start_pos + marker_match.start()
-                            tag_open = html_content.rfind('<', 0, marker_pos_in_full)
-                            if tag_open != -1:
-                                end_pos = tag_open
-                            else:
-                                end_pos = marker_pos_in_full
-                            break
+                    marker_pos = _end_marker_start(start_pos)
+                    if marker_pos != -1:
+                        end_pos = marker_pos
 
                 positions[item_num] = (start_pos, end_pos)
         
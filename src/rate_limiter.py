@@ -0,0 +1,49 @@
+"""
+Thread-safe token-bucket rate limiter for SEC EDGAR requests
+"""
+
+import threading
+import time
+from typing import Optional
+
+from script.config import SEC_MAX_REQUESTS_PER_SECOND
+
+
+class TokenBucket:
+    """Grants up to `rate` acquisitions per second, shared across threads"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize TokenBucket
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (defaults to 1, i.e. evenly spaced
+                requests that never exceed `rate` within any second)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity is not None else 1.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block until `tokens` are available, then consume them"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            # Sleep outside the lock so other threads can refill/check.
+            time.sleep(wait)
+
+
+# Process-wide limiter shared by every downloader/index parser by default,
+# so parallel workers together stay within SEC's fair-access limit.
+SEC_RATE_LIMITER = TokenBucket(SEC_MAX_REQUESTS_PER_SECOND)
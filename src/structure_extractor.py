@@ -3,10 +3,66 @@ Structure Extractor - Extract hierarchical heading-body pairs from SEC filing it
 """
 
 from bs4 import BeautifulSoup, Tag
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 import re
+import string
 import unicodedata
 
+from .text_utils import format_char_translation
+
+
+# One str.translate pass for _clean_text: drop Cf characters, fold smart
+# quotes and dashes to ASCII, and blank out bullet glyphs.
+_CLEAN_TEXT_TRANSLATION = format_char_translation(
+    {
+        **dict.fromkeys("\u2018\u2019", "'"),
+        **dict.fromkeys("\u201c\u201d", '"'),
+        **dict.fromkeys("\u2013\u2014", "-"),
+        **dict.fromkeys("\u2022\u25CF\u25A0\u25AA\u25E6\u2043\u2219", " "),
+    }
+)
+
+# Byte sets for the ASCII upper-case ratio in _get_heading_info: deleting
+# these with bytes.translate keeps the A-Za-z letters, then the upper-case ones.
+_NON_LETTER_BYTES = bytes(b for b in range(128) if not chr(b).isalpha())
+_LOWERCASE_BYTES = string.ascii_lowercase.encode('ascii')
+
+# Block tags whose presence inside a <div> makes the div a mere container.
+_DIV_CHILD_BLOCK_TAGS = frozenset(['p', 'li', 'td', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+
+
+class _BlockFeatures:
+    """Style facts about one block, gathered in a single descendant walk."""
+
+    __slots__ = ('style_blob', 'has_bold_tag', 'has_italic_tag', 'bold_nodes')
+
+    def __init__(self, style_blob: str, has_bold_tag: bool, has_italic_tag: bool, bold_nodes: List[Tag]):
+        self.style_blob = style_blob
+        self.has_bold_tag = has_bold_tag
+        self.has_italic_tag = has_italic_tag
+        # b/strong descendants and descendants with a bold inline style, in order.
+        self.bold_nodes = bold_nodes
+
+
+class _StructureElement:
+    """One heading or body entry of the flat list _build_hierarchy nests."""
+
+    __slots__ = ('is_heading', 'layer', 'style_type', 'heading', 'content')
+
+    def __init__(
+        self,
+        is_heading: bool,
+        layer: int = 0,
+        style_type: Optional[str] = None,
+        heading: Optional[str] = None,
+        content: Optional[str] = None,
+    ):
+        self.is_heading = is_heading
+        self.layer = layer
+        self.style_type = style_type
+        self.heading = heading
+        self.content = content
+
 
 class StructureExtractor:
     """Extracts hierarchical heading-body structure from SEC filing item HTML"""
@@ -16,10 +72,34 @@ class StructureExtractor:
         # Heading tags in priority order
         self.heading_tags = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
         self.block_tags = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'li', 'div', 'table']
+        self._block_tag_set = frozenset(self.block_tags)
         # Minimum text length to consider as heading
         self.min_heading_length = 3
         self.max_heading_length = 220
         self.max_bold_sentence_heading_length = 520
+
+        # Pre-compiled patterns; the helpers below run once or more per block.
+        self._bold_style_pattern = re.compile(r'font-weight\s*:\s*(bold|[6-9]00)')
+        self._italic_style_pattern = re.compile(r'font-style\s*:\s*italic')
+        self._underline_style_pattern = re.compile(r'text-decoration\s*:\s*underline')
+        self._center_style_pattern = re.compile(r'text-align\s*:\s*center')
+        self._item_heading_pattern = re.compile(r'^\s*items?\s+\d+[a-z]?\b', re.IGNORECASE)
+        self._item_token_pattern = re.compile(r'items?\s+(\d+[a-z]?)', re.IGNORECASE)
+        self._item_prefix_pattern = re.compile(r'^\s*item\s+\d+[a-z]?\s*\.?\s*', re.IGNORECASE)
+        self._part_label_pattern = re.compile(r'part\s+[ivxlcdm]+')
+        self._table_label_pattern = re.compile(r'^table\s+\d+(\.\d+)*[:.]?\b')
+        self._page_label_pattern = re.compile(r'page\s+\d{1,4}(?:\s+of\s+\d{1,4})?')
+        self._form_header_pattern = re.compile(r'\|\s*\d{4}\s*Form\s*10-[KQ]\s*\|')
+        self._titlecase_pattern = re.compile(r'^[A-Z][A-Za-z0-9,&/\-\'(). ]+$')
+        self._word_pattern = re.compile(r"[A-Za-z][A-Za-z'\\-]*")
+        self._name_intro_patterns = [
+            re.compile(r'^(Mr|Ms|Mrs|Dr)\.\s+[A-Z][A-Za-z\'\-]+(?:\s+[A-Z][A-Za-z\'\-]+){0,3}\s+is\b'),
+            re.compile(r'^[A-Z][A-Za-z\'\-]+(?:\s+[A-Z][A-Za-z\'\-]+){1,4}\s*,\s*\d{1,3}\s*,?\s+has\b'),
+            re.compile(r'^[A-Z][A-Za-z\'\-]+(?:\s+[A-Z][A-Za-z\'\-]+){1,4}\s+is\b'),
+        ]
+        self._apostrophe_pattern = re.compile(r"['’]")
+        self._alnum_run_pattern = re.compile(r'[A-Za-z0-9]+')
+        self._script_style_tag_pattern = re.compile(r'<(?:script|style)\b', re.IGNORECASE)
     
     def extract_structure(self, item_html: str, root_heading: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -33,14 +113,16 @@ class StructureExtractor:
         """
         soup = BeautifulSoup(item_html, 'lxml')
         
-        # Remove script and style tags
-        for tag in soup(['script', 'style']):
-            tag.decompose()
+        # Remove script and style tags; most items have none, and the raw
+        # HTML check is cheaper than a full tree walk to find that out.
+        if self._script_style_tag_pattern.search(item_html):
+            for tag in soup(['script', 'style']):
+                tag.decompose()
         
-        # Build flat list of all potential elements first
+        # Stream candidate elements in document order
         elements = self._collect_elements(soup)
         
-        # Build hierarchical structure from flat list
+        # Build hierarchical structure as the elements arrive
         structure = self._build_hierarchy(elements)
         
         # If no structure found, return simple text
@@ -61,18 +143,18 @@ class StructureExtractor:
 
         return structure
     
-    def _collect_elements(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+    def _collect_elements(self, soup: BeautifulSoup) -> Iterator[_StructureElement]:
         """
         Collect all heading and content elements from the soup
         
         Args:
             soup: BeautifulSoup object
             
-        Returns:
-            List of element dictionaries with type, layer, heading, and raw_element
+        Yields:
+            Heading elements (layer, style_type, heading) and body elements
+            (content) in document order, one block at a time, so
+            _build_hierarchy can consume them without a full flat list
         """
-        elements: List[Dict[str, Any]] = []
-
         for block in self._iter_blocks_in_order(soup):
             text = self._clean_text(block.get_text())
             if not text:
@@ -82,66 +164,81 @@ class StructureExtractor:
             if self._looks_like_noise_line(text):
                 continue
 
-            split = self._split_bold_lead(block, text)
+            features = self._inspect_block(block)
+            split = self._split_bold_lead(block, text, features)
             if split is not None:
                 heading_text, body_text = split
-                heading_info = self._get_heading_info(block, heading_text)
+                heading_info = self._get_heading_info(block, heading_text, features)
                 if heading_info is None:
                     heading_info = {'text': heading_text, 'level': 2, 'style_type': 'bold'}
-                elements.append({
-                    'type': 'heading',
-                    'layer': heading_info['level'],
-                    'style_type': heading_info['style_type'],
-                    'heading': heading_info['text'],
-                    'element': block,
-                    'is_heading': True
-                })
+                yield _StructureElement(
+                    is_heading=True,
+                    layer=heading_info['level'],
+                    style_type=heading_info['style_type'],
+                    heading=heading_info['text'],
+                )
                 if body_text:
-                    elements.append({
-                        'type': 'body',
-                        'content': body_text,
-                        'element': block,
-                        'is_heading': False
-                    })
+                    yield _StructureElement(is_heading=False, content=body_text)
                 continue
 
-            heading_info = self._get_heading_info(block, text)
+            heading_info = self._get_heading_info(block, text, features)
             if heading_info is not None:
-                elements.append({
-                    'type': 'heading',
-                    'layer': heading_info['level'],
-                    'style_type': heading_info['style_type'],
-                    'heading': heading_info['text'],
-                    'element': block,
-                    'is_heading': True
-                })
-            elif self._is_body_content(block, text):
-                elements.append({
-                    'type': 'body',
-                    'content': text,
-                    'element': block,
-                    'is_heading': False
-                })
-        
-        return elements
+                yield _StructureElement(
+                    is_heading=True,
+                    layer=heading_info['level'],
+                    style_type=heading_info['style_type'],
+                    heading=heading_info['text'],
+                )
+            else:
+                # Same outcome as _is_body_content(block, text, features):
+                # heading_info is already None, and empty, page-marker and
+                # noise text was skipped above.
+                yield _StructureElement(is_heading=False, content=text)
 
-    def _split_bold_lead(self, block: Tag, text: str) -> Optional[tuple]:
+    def _inspect_block(self, block: Tag) -> _BlockFeatures:
+        """
+        Walk a block's descendants once, collecting what the style checks in
+        _split_bold_lead, _get_heading_info and _bold_only_bullet need.
+        """
+        styles = []
+        if block.get('style'):
+            styles.append(block.get('style'))
+        has_bold_tag = False
+        has_italic_tag = False
+        bold_nodes: List[Tag] = []
+        for node in block.descendants:
+            if not isinstance(node, Tag):
+                continue
+            name = node.name
+            style = node.get('style')
+            if style:
+                styles.append(style)
+            if name in ('i', 'em'):
+                has_italic_tag = True
+            if name in ('b', 'strong'):
+                has_bold_tag = True
+                bold_nodes.append(node)
+            elif style and self._bold_style_pattern.search(style.lower()):
+                bold_nodes.append(node)
+        return _BlockFeatures(
+            style_blob=" ".join(styles).lower(),
+            has_bold_tag=has_bold_tag,
+            has_italic_tag=has_italic_tag,
+            bold_nodes=bold_nodes,
+        )
+
+    def _split_bold_lead(self, block: Tag, text: str,
+                         features: Optional[_BlockFeatures] = None) -> Optional[tuple]:
         """
         If a block starts with a bold lead-in (e.g., 'Talent Development.')
         followed by regular text, split into heading + body.
         """
         if not text:
             return None
+        if features is None:
+            features = self._inspect_block(block)
         # Find the first bold-ish descendant.
-        lead = None
-        for node in block.find_all(True):
-            if node.name in {'b', 'strong'}:
-                lead = node.get_text()
-                break
-            style = (node.get('style') or '').lower()
-            if re.search(r'font-weight\s*:\s*(bold|[6-9]00)', style):
-                lead = node.get_text()
-                break
+        lead = features.bold_nodes[0].get_text() if features.bold_nodes else None
         if not lead:
             return None
         lead_clean = self._clean_text(lead)
@@ -169,55 +266,69 @@ class StructureExtractor:
         Yield candidate text blocks in document order.
         Skip container divs that only wrap smaller block elements to avoid duplicates.
         """
-        for tag in soup.find_all(self.block_tags):
+        # One walk over the tree (parents come before children) records the
+        # blocks plus the two facts the filters below need, instead of a
+        # find() per div and a find_parent() per block.
+        block_names = self._block_tag_set
+        blocks: List[Tag] = []
+        in_table = set()  # id() of tags with a <table> ancestor
+        wraps_block = set()  # id() of tags with a p/li/td/h1-h6 descendant
+        for node in soup.descendants:
+            if not isinstance(node, Tag):
+                continue
+            parent = node.parent
+            if parent is not None and (parent.name == 'table' or id(parent) in in_table):
+                in_table.add(id(node))
+            if node.name in _DIV_CHILD_BLOCK_TAGS:
+                # Stop at the first ancestor already marked: everything above
+                # it was marked by an earlier walk.
+                while parent is not None and id(parent) not in wraps_block:
+                    wraps_block.add(id(parent))
+                    parent = parent.parent
+            if node.name in block_names:
+                blocks.append(node)
+
+        for tag in blocks:
             if tag.name == 'div':
-                if tag.find(['p', 'li', 'td', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
+                if id(tag) in wraps_block:
                     continue
             if tag.name == 'table':
                 # Treat table as one plain body block, skip nested cells elsewhere.
                 yield tag
                 continue
-            if tag.find_parent('table'):
+            if id(tag) in in_table:
                 continue
             yield tag
 
-    def _style_blob(self, tag: Tag) -> str:
-        """
-        Aggregate style attributes from tag and descendants.
-        """
-        chunks = []
-        if tag.get('style'):
-            chunks.append(tag.get('style'))
-        for child in tag.find_all(True):
-            st = child.get('style')
-            if st:
-                chunks.append(st)
-        return " ".join(chunks).lower()
-
     def _is_item_heading_text(self, text: str) -> bool:
-        return bool(re.match(r'^\s*items?\s+\d+[a-z]?\b', text, flags=re.IGNORECASE))
+        return bool(self._item_heading_pattern.match(text))
 
     def _looks_like_noise_line(self, text: str) -> bool:
         t = text.strip().lower()
         if t in {"table of contents", "index to exhibits", "index to financial statements"}:
             return True
-        if re.fullmatch(r'part\s+[ivxlcdm]+', t):
-            return True
-        if re.match(r'^table\s+\d+(\.\d+)*[:.]?\b', t):
-            return True
-        if re.fullmatch(r'\d{1,4}', t):
-            return True
-        if re.fullmatch(r'page\s+\d{1,4}(?:\s+of\s+\d{1,4})?', t):
+        # Bare page number: \d{1,4} matches exactly the str.isdecimal() digits.
+        if t.isdecimal() and len(t) <= 4:
             return True
+        # The remaining labels need their leading word; most lines fail here
+        # without running a regex.
+        if t.startswith('part'):
+            return self._part_label_pattern.fullmatch(t) is not None
+        if t.startswith('table'):
+            return self._table_label_pattern.match(t) is not None
+        if t.startswith('page'):
+            return self._page_label_pattern.fullmatch(t) is not None
         return False
 
-    def _get_heading_info(self, block: Tag, text: str) -> Optional[Dict[str, Any]]:
+    def _get_heading_info(self, block: Tag, text: str,
+                          features: Optional[_BlockFeatures] = None) -> Optional[Dict[str, Any]]:
         """
         Determine whether a block is a heading and assign layer.
         
         Args:
             block: Block element
             text: Cleaned block text
+            features: Precomputed _inspect_block(block) result, if any
             
         Returns:
             Dictionary with heading info or None
@@ -227,21 +338,25 @@ class StructureExtractor:
         if block.name == 'table':
             return None
 
-        style_blob = self._style_blob(block)
-        has_bold = bool(re.search(r'font-weight\s*:\s*(bold|[6-9]00)', style_blob)) or block.find(['b', 'strong']) is not None
-        has_italic = bool(re.search(r'font-style\s*:\s*italic', style_blob)) or block.find(['i', 'em']) is not None
-        has_underline = bool(re.search(r'text-decoration\s*:\s*underline', style_blob))
-        is_center = bool(re.search(r'text-align\s*:\s*center', style_blob)) or (str(block.get('align', '')).lower() == 'center')
-
         if self._is_item_heading_text(text):
             return {'text': text, 'level': 1, 'style_type': 'item'}
 
+        if features is None:
+            features = self._inspect_block(block)
+        # Separate searches on purpose: each pattern starts with a literal that
+        # sre scans for quickly, which a combined alternation would lose.
+        style_blob = features.style_blob
+        has_bold = features.has_bold_tag or bool(style_blob and self._bold_style_pattern.search(style_blob))
+        has_italic = features.has_italic_tag or bool(style_blob and self._italic_style_pattern.search(style_blob))
+        has_underline = bool(style_blob and self._underline_style_pattern.search(style_blob))
+        is_center = bool(style_blob and self._center_style_pattern.search(style_blob)) or (str(block.get('align', '')).lower() == 'center')
+
         # Avoid false layer-3 headings where only a person's name is bolded in
         # an executive-officer biography sentence (e.g., "Mr. X is ...").
         if has_bold and self._is_name_intro_sentence(text):
             return None
         # Avoid treating bullet list items as headings when only the bullet is bold.
-        if has_bold and self._bold_only_bullet(block):
+        if has_bold and self._bold_only_bullet(block, features):
             return None
 
         # Length guardrails:
@@ -263,11 +378,11 @@ class StructureExtractor:
             score += 1
 
         # Title-like forms: ALL CAPS or short title without trailing punctuation.
-        letters = re.sub(r'[^A-Za-z]', '', text)
-        upper_ratio = (sum(ch.isupper() for ch in letters) / len(letters)) if letters else 0.0
+        letters = text.encode('ascii', 'ignore').translate(None, _NON_LETTER_BYTES)
+        upper_ratio = (len(letters.translate(None, _LOWERCASE_BYTES)) / len(letters)) if letters else 0.0
         if upper_ratio >= 0.60:
             score += 1
-        if re.match(r'^[A-Z][A-Za-z0-9,&/\-\'(). ]+$', text) and not text.endswith('.'):
+        if self._titlecase_pattern.match(text) and not text.endswith('.'):
             score += 1
 
         # Long sentence-like lines are usually body, not heading, unless explicitly bold.
@@ -309,12 +424,7 @@ class StructureExtractor:
         if ":" in t[:80]:
             return False
 
-        patterns = [
-            r'^(Mr|Ms|Mrs|Dr)\.\s+[A-Z][A-Za-z\'\-]+(?:\s+[A-Z][A-Za-z\'\-]+){0,3}\s+is\b',
-            r'^[A-Z][A-Za-z\'\-]+(?:\s+[A-Z][A-Za-z\'\-]+){1,4}\s*,\s*\d{1,3}\s*,?\s+has\b',
-            r'^[A-Z][A-Za-z\'\-]+(?:\s+[A-Z][A-Za-z\'\-]+){1,4}\s+is\b',
-        ]
-        return any(re.match(p, t) for p in patterns)
+        return any(p.match(t) for p in self._name_intro_patterns)
 
     def _looks_like_titlecase_heading(self, text: str) -> bool:
         """
@@ -325,33 +435,32 @@ class StructureExtractor:
             return False
         if len(t) > 260:
             return False
-        words = re.findall(r"[A-Za-z][A-Za-z'\\-]*", t)
+        words = self._word_pattern.findall(t)
         if len(words) < 4:
             return False
         capped = sum(1 for w in words if w[0].isupper())
         return (capped / max(1, len(words))) >= 0.6
 
-    def _bold_only_bullet(self, block: Tag) -> bool:
+    def _bold_only_bullet(self, block: Tag, features: Optional[_BlockFeatures] = None) -> bool:
         """
         Detect cases where a bullet is bold but the actual sentence is not.
         """
+        if features is None:
+            features = self._inspect_block(block)
         found_bold = False
-        for node in block.find_all(True):
-            style = (node.get('style') or '').lower()
-            is_bold = node.name in {'b', 'strong'} or bool(re.search(r'font-weight\s*:\s*(bold|[6-9]00)', style))
-            if not is_bold:
-                continue
+        for node in features.bold_nodes:
             found_bold = True
             txt = self._clean_text(node.get_text())
             if txt and txt not in {'•'}:
                 return False
         return found_bold
 
-    def _is_body_content(self, block: Tag, text: str) -> bool:
+    def _is_body_content(self, block: Tag, text: str,
+                         features: Optional[_BlockFeatures] = None) -> bool:
         """
         Check if block is body content.
         """
-        if self._get_heading_info(block, text):
+        if self._get_heading_info(block, text, features):
             return False
         if not text:
             return False
@@ -362,22 +471,34 @@ class StructureExtractor:
         return True
 
     def _extract_item_token(self, title: str) -> Optional[str]:
-        m = re.search(r'items?\s+(\d+[a-z]?)', title or '', flags=re.IGNORECASE)
+        m = self._item_token_pattern.search(title or '')
         return m.group(1).upper() if m else None
 
-    def _is_item_heading_node(self, node: Dict[str, Any], token: Optional[str]) -> bool:
+    def _item_heading_node_pattern(self, token: Optional[str]) -> re.Pattern:
+        if not token:
+            return self._item_heading_pattern
+        return re.compile(rf'^\s*items?\s+{re.escape(token)}\b', re.IGNORECASE)
+
+    def _is_item_heading_node(self, node: Dict[str, Any], token: Optional[str],
+                              pattern: Optional[re.Pattern] = None) -> bool:
         if node.get('type') != 'heading':
             return False
         h = str(node.get('heading') or '')
-        if not token:
-            return bool(re.match(r'^\s*items?\s+\d+[a-z]?\b', h, flags=re.IGNORECASE))
-        return bool(re.match(rf'^\s*items?\s+{re.escape(token)}\b', h, flags=re.IGNORECASE))
+        if pattern is None:
+            pattern = self._item_heading_node_pattern(token)
+        return bool(pattern.match(h))
 
     def _bump_layers(self, nodes: List[Dict[str, Any]], min_layer: int = 2) -> None:
-        for n in nodes:
+        # Explicit stack: each node only depends on its own depth, so visit
+        # order is free and deep nesting cannot hit the recursion limit.
+        stack = [(n, min_layer) for n in nodes]
+        while stack:
+            n, node_min_layer = stack.pop()
             if n.get('type') == 'heading':
-                n['layer'] = max(int(n.get('layer', min_layer)), min_layer)
-            self._bump_layers(n.get('children') or [], min_layer=min_layer + 1)
+                n['layer'] = max(int(n.get('layer', node_min_layer)), node_min_layer)
+            children = n.get('children')
+            if children:
+                stack.extend((child, node_min_layer + 1) for child in children)
 
     def _apply_root_heading(self, structure: List[Dict[str, Any]], root_heading: str) -> List[Dict[str, Any]]:
         root_title = self._clean_text(root_heading)
@@ -385,11 +506,12 @@ class StructureExtractor:
             return structure
 
         token = self._extract_item_token(root_title)
+        item_heading_pattern = self._item_heading_node_pattern(token)
         root_body_parts: List[str] = []
         root_children: List[Dict[str, Any]] = []
 
         for node in structure:
-            if self._is_item_heading_node(node, token):
+            if self._is_item_heading_node(node, token, item_heading_pattern):
                 body = (node.get('body') or '').strip()
                 if body:
                     root_body_parts.append(self._strip_redundant_root_prefix(body, root_title))
@@ -443,9 +565,10 @@ class StructureExtractor:
         if not txt:
             return txt
         def norm(s: str) -> str:
-            s = re.sub(r"['’]", '', s)
-            s = re.sub(r'[^A-Za-z0-9]+', ' ', s)
-            return re.sub(r'\s+', ' ', s).strip().lower()
+            # ASCII alphanumeric runs (apostrophes dropped), lowercased and
+            # joined by single spaces.
+            s = self._apostrophe_pattern.sub('', s)
+            return ' '.join(self._alnum_run_pattern.findall(s)).lower()
 
         def strip_prefix(original: str, prefix_norm: str) -> Optional[str]:
             if not prefix_norm:
@@ -472,66 +595,82 @@ class StructureExtractor:
             return original[last_index:].lstrip(" .:-|,;/")
 
         root_clean = root_title or ''
-        root_no_item = re.sub(r'^\s*item\s+\d+[a-z]?\s*\.?\s*', '', root_clean, flags=re.IGNORECASE)
-        candidates = [root_clean, root_no_item]
-        for cand in candidates:
-            cand_norm = norm(cand)
-            if cand_norm and norm(txt).startswith(cand_norm):
+        root_no_item = self._item_prefix_pattern.sub('', root_clean)
+        cand_norms = [norm(root_clean), norm(root_no_item)]
+        need = max(len(cand_norm) for cand_norm in cand_norms)
+        if not need:
+            return txt
+        # norm() of a leading slice is a prefix of norm(txt), so comparing
+        # against the titles only needs the head of a long body.
+        head_len = 4 * need + 64
+        txt_norm = norm(txt[:head_len])
+        if len(txt_norm) < need and len(txt) > head_len:
+            txt_norm = norm(txt)
+        for cand_norm in cand_norms:
+            if cand_norm and txt_norm.startswith(cand_norm):
                 stripped = strip_prefix(txt, cand_norm)
                 if stripped is not None:
                     return stripped.strip()
         return txt
 
-    def _build_hierarchy(self, elements: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _build_hierarchy(self, elements: Iterable[_StructureElement]) -> List[Dict[str, Any]]:
         """
-        Build hierarchical structure from flat list of elements.
+        Build hierarchical structure from a flat sequence of elements.
         """
-        if not elements:
-            return []
-
         structure: List[Dict[str, Any]] = []
-        heading_stack: List[Dict[str, Any]] = []
+        # Open headings, innermost last, each with its list of body fragments.
+        heading_stack: List[Tuple[Dict[str, Any], List[str]]] = []
+        # Body fragments of every node, joined once at the end instead of
+        # growing node['body'] by repeated string concatenation.
+        body_parts: List[Tuple[Dict[str, Any], List[str]]] = []
+        # Pre-heading text: at most one simple_text node, since the heading
+        # stack never empties again once a heading has been seen.
+        simple_parts: Optional[List[str]] = None
 
         for elem in elements:
-            if elem['is_heading']:
-                level = int(elem['layer'])
+            if elem.is_heading:
+                level = int(elem.layer)
 
-                while heading_stack and heading_stack[-1]['layer'] >= level:
+                while heading_stack and heading_stack[-1][0]['layer'] >= level:
                     heading_stack.pop()
 
                 heading_entry = {
                     'type': 'heading',
                     'layer': level,
-                    'heading': elem['heading'],
+                    'heading': elem.heading,
                     'body': None,
                     'children': []
                 }
 
                 if heading_stack:
-                    heading_stack[-1]['children'].append(heading_entry)
+                    heading_stack[-1][0]['children'].append(heading_entry)
                 else:
                     structure.append(heading_entry)
 
-                heading_stack.append(heading_entry)
+                parts: List[str] = []
+                body_parts.append((heading_entry, parts))
+                heading_stack.append((heading_entry, parts))
             else:
                 if not heading_stack:
                     # Keep pre-heading text if present
-                    if structure and structure[-1].get('type') == 'simple_text':
-                        structure[-1]['body'] += ' ' + elem['content']
-                    else:
-                        structure.append({
+                    if simple_parts is None:
+                        simple_text = {
                             'type': 'simple_text',
                             'layer': 1,
                             'heading': None,
-                            'body': elem['content'],
+                            'body': None,
                             'children': []
-                        })
+                        }
+                        structure.append(simple_text)
+                        simple_parts = []
+                        body_parts.append((simple_text, simple_parts))
+                    simple_parts.append(elem.content)
                 else:
-                    cur = heading_stack[-1]
-                    if cur['body'] is None:
-                        cur['body'] = elem['content']
-                    else:
-                        cur['body'] += ' ' + elem['content']
+                    heading_stack[-1][1].append(elem.content)
+
+        for node, parts in body_parts:
+            if parts:
+                node['body'] = ' '.join(parts)
 
         return structure
 
@@ -540,7 +679,7 @@ class StructureExtractor:
         if 'PAGE_BREAK_MARKER' in text:
             return True
         # Check for patterns like "Apple Inc. | 2022 Form 10-K | 1"
-        if re.search(r'\|\s*\d{4}\s*Form\s*10-[KQ]\s*\|', text):
+        if self._form_header_pattern.search(text):
             return True
         return False
 
@@ -556,22 +695,12 @@ class StructureExtractor:
         """
         if not text:
             return ''
-        text = unicodedata.normalize("NFKC", text)
-        text = "".join(ch for ch in text if unicodedata.category(ch) != "Cf")
-        text = text.replace('\u2018', "'").replace('\u2019', "'")
-        text = text.replace('\u201c', '"').replace('\u201d', '"')
-        text = text.replace('\u2013', '-').replace('\u2014', '-')
-        text = re.sub(r'[\u2022\u25CF\u25A0\u25AA\u25E6\u2043\u2219]', ' ', text)
+        # NFKC already turns \xa0 into a plain space, and the zero-width
+        # artifacts (\u200b-\u200d, \ufeff) are Cf characters dropped here.
+        text = unicodedata.normalize("NFKC", text).translate(_CLEAN_TEXT_TRANSLATION)
 
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
-        
-        # Remove special characters that are artifacts
-        text = re.sub(r'[\xa0\u200b\u200c\u200d\ufeff]', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
-        
-        return text.strip()
+        return ' '.join(text.split())
 
     # Legacy helper kept for compatibility; unused in current style-based layering.
     def _get_heading_layer(self, tag_name: str, heading_stack: List[tuple]) -> int:
@@ -7,10 +7,11 @@ from __future__ import annotations
 import base64
 import binascii
 import mimetypes
+import mmap
 import re
 from dataclasses import dataclass
-from pathlib import PurePosixPath
-from typing import Dict, List, Optional, Tuple
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 
@@ -28,6 +29,33 @@ _PERIOD_PATTERN = re.compile(
     r"(?:(CONFORMED|CONFIRMED)[\s_\-]+)?PERIOD[\s_\-]*OF[\s_\-]*REPORT\b\s*[:=]?\s*([12]\d{7})",
     re.IGNORECASE,
 )
+_TRADING_SYMBOL_PATTERN = re.compile(
+    r'name\s*=\s*["\']dei:TradingSymbol["\'][^>]*>(.*?)</',
+    re.IGNORECASE | re.DOTALL,
+)
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+_SYMBOL_TOKEN_PATTERN = re.compile(r"[A-Z0-9.\-]+")
+
+
+def read_submission_text(path: Union[str, Path], errors: str = "ignore") -> str:
+    """
+    Read a UTF-8 text file through a read-only mmap.
+
+    Decoding straight from the mapping avoids holding a separate bytes copy
+    of a multi-MB submission next to the decoded str. Newlines are
+    normalized like text-mode reads (Path.read_text).
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped.
+            return ""
+        with mm:
+            text = str(mm, "utf-8", errors)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
 
 
 def parse_submission_documents(submission_text: str) -> List[SubmissionDocument]:
@@ -60,14 +88,10 @@ def extract_period_of_report(submission_text: str) -> Tuple[Optional[str], Optio
 def extract_trading_symbols(text: str) -> List[str]:
     out: List[str] = []
     seen = set()
-    for match in re.finditer(
-        r'name\s*=\s*["\']dei:TradingSymbol["\'][^>]*>(.*?)</',
-        text or "",
-        flags=re.IGNORECASE | re.DOTALL,
-    ):
-        raw = re.sub(r"<[^>]+>", " ", match.group(1))
+    for match in _TRADING_SYMBOL_PATTERN.finditer(text or ""):
+        raw = _TAG_PATTERN.sub(" ", match.group(1))
         token = " ".join(raw.split()).strip().upper()
-        if token and re.fullmatch(r"[A-Z0-9.\-]+", token) and token not in seen:
+        if token and token not in seen and _SYMBOL_TOKEN_PATTERN.fullmatch(token):
             seen.add(token)
             out.append(token)
     return out
@@ -163,7 +187,7 @@ def decode_submission_document_bytes(doc: SubmissionDocument) -> Optional[bytes]
     if text.lstrip().startswith("begin "):
         try:
             return _decode_uu_payload(text)
-        except Exception:
+        except (binascii.Error, ValueError):
             pass
 
     compact = re.sub(r"\s+", "", text)
@@ -0,0 +1,23 @@
+"""
+Text cleaning helpers shared by the TOC parser and the structure extractor.
+"""
+
+import sys
+import unicodedata
+from typing import Dict, Mapping, Optional
+
+
+# Invisible format (Cf) characters: zero-width spaces/joiners, BOM, soft
+# hyphen, ... Read from unicodedata once per process instead of
+# categorizing every character of every cleaned string.
+_FORMAT_CHAR_DELETIONS: Dict[int, None] = dict.fromkeys(
+    cp for cp in range(sys.maxunicode + 1) if unicodedata.category(chr(cp)) == "Cf"
+)
+
+
+def format_char_translation(replacements: Mapping[str, str]) -> Dict[int, Optional[str]]:
+    """
+    Build a str.translate table that drops every Cf character and maps each
+    single-character key of replacements to its value.
+    """
+    return {**_FORMAT_CHAR_DELETIONS, **str.maketrans(dict(replacements))}